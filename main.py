@@ -1,20 +1,47 @@
+import argparse
+from contextlib import nullcontext
+
 import src.utils as utils
+from src.profiling import PROFILE_FORMATS, PipelineProfiler
 
 
 def main():
-    founded_vacancies = utils.get_vacancies()
+    parser = argparse.ArgumentParser(description="Поиск, фильтрация и сохранение вакансий hh.ru")
+    parser.add_argument('--profile', metavar='FILE', help="Профилировать запуск и сохранить профиль в FILE")
+    parser.add_argument('--profile-format', choices=PROFILE_FORMATS, default='pstats',
+                        help="Формат профиля: pstats (cProfile) или collapsed (стеки для flame graph)")
+    args = parser.parse_args()
+
+    if args.profile is None:
+        run(nullcontext)
+        return
+
+    profiler = PipelineProfiler(args.profile, args.profile_format)
+
+    try:
+        with profiler:
+            run(profiler.stage)
+    finally:
+        print(profiler.summary())
+
+
+def run(stage):
+    with stage('get_vacancies'):
+        founded_vacancies = utils.get_vacancies()
 
-    user_answer = input("Выберите формат файла для сохранения:\n"
+    user_answer = input("Выберите формат файла для сохранения (вакансии дописываются к существующему файлу):\n"
                         "1. JSON\n"
                         "2. CSV\n"
                         "3. TXT\n"
-                        "4. Excel\n")
+                        "4. Excel\n"
+                        "5. Все форматы\n")
 
     match user_answer:
-        case '1' | '2' | '3' | '4':
-            utils.save_vacancies(founded_vacancies, user_answer)
+        case '1' | '2' | '3' | '4' | '5':
+            with stage('save_vacancies'):
+                utils.save_vacancies(founded_vacancies, user_answer)
         case _:
-            print("Диапазон ввода [1-4]")
+            print("Диапазон ввода [1-5]")
 
 
 if __name__ == '__main__':
@@ -1,10 +1,20 @@
 import requests
-from typing import Union
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Union
 import json
 import csv
+import os
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 import pandas as pd
 
 from src.abstract_classes import VacancyService, VacancyStorage
+from src.file_io import atomic_open, atomic_path, detect_compression, open_compressed, writer_lock
+from src.mmap_index import MappedVacancyIndex
+from src.query import Query, as_query
+from src.rate_limit import RateLimiter
 
 
 class HHVacancyService(VacancyService):
@@ -15,35 +25,100 @@ class HHVacancyService(VacancyService):
     о вакансиях, такую как название, URL, информация о зарплате и описание.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, session: requests.Session = None, rate_limiter: RateLimiter = None) -> None:
         """
         Инициализирует экземпляр класса HHVacancyService.
 
-        Устанавливает базовый URL для доступа к API вакансий hh.ru.
+        Устанавливает базовый URL для доступа к API вакансий hh.ru и HTTP-сессию, которая переиспользует соединения
+        между запросами.
+
+        :param session: HTTP-сессия (по умолчанию создаётся новая).
+        :param rate_limiter: Ограничитель частоты запросов, общий для всех потоков, использующих сервис, например
+                             AdaptiveRateLimiter (по умолчанию запросы не ограничиваются).
         """
 
         self.base_url = "https://api.hh.ru/vacancies"
+        self.session = session or requests.Session()
+        self.rate_limiter = rate_limiter
+        self.max_retries = 5
 
-    def fetch_vacancies(self, search_query: str) -> list:
+    def fetch_vacancies(self, search_query: str, area: str = "113") -> list:
         """
         Выполняет запрос к API hh.ru для получения вакансий по заданному поисковому запросу.
 
         Константные значения:
-            - area: 113 - Регион поиска - Россия
             - per_page: - Количество возвращаемых вакансий
 
         :param search_query: текст поискового запроса, по которому необходимо найти вакансии.
+        :param area: идентификатор региона поиска (по умолчанию 113 - Россия).
         :return: список словарей, каждый из которых содержит информацию о вакансии (название, URL, информация о зарплате
                  и описание).
         """
 
-        params = {"text": search_query, "area": "113", "per_page": 100}
-        response = requests.get(self.base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = self.fetch_page({"text": search_query, "area": area, "per_page": 100})
 
         return self._parse_vacancies(data['items'])
 
+    def fetch_page(self, params: dict) -> dict:
+        """
+        Выполняет один запрос к API hh.ru с произвольными параметрами поиска.
+
+        Если задан rate_limiter, перед запросом ожидается разрешение ограничителя, а ответ сервера передаётся ему
+        обратно: успешный запрос - через on_success, ответ 429 или требование captcha - через on_throttle с учётом
+        заголовка Retry-After. Отклонённый из-за частоты запрос повторяется до max_retries раз.
+
+        :param params: параметры запроса (text, area, page, per_page, date_from, date_to и т.д.).
+        :return: ответ API в исходном виде (items, found, pages, page, per_page).
+        """
+
+        if self.rate_limiter is None:
+            response = self.session.get(self.base_url, params=params)
+            response.raise_for_status()
+
+            return response.json()
+
+        for _ in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(self.base_url, params=params)
+
+            if not self._is_throttled(response):
+                break
+
+            self.rate_limiter.on_throttle(self._retry_after(response))
+
+        response.raise_for_status()
+        self.rate_limiter.on_success()
+
+        return response.json()
+
+    @staticmethod
+    def _is_throttled(response: requests.Response) -> bool:
+        """
+        Определяет, отклонён ли запрос из-за превышения частоты запросов.
+
+        :param response: ответ API.
+        :return: True для ответа 429 или ответа 403 с требованием captcha, иначе False.
+        """
+
+        if response.status_code == 429:
+            return True
+
+        return response.status_code == 403 and 'captcha_required' in response.text
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Union[float, None]:
+        """
+        Извлекает рекомендованную паузу из заголовка Retry-After.
+
+        :param response: ответ API.
+        :return: пауза в секундах или None, если заголовок отсутствует или задан не числом.
+        """
+
+        try:
+            return float(response.headers['Retry-After'])
+        except (KeyError, ValueError):
+            return None
+
     @staticmethod
     def _parse_vacancies(vacancies_data: list) -> list:
         """
@@ -78,12 +153,79 @@ class HHVacancyService(VacancyService):
         return vacancies
 
 
+class SalaryRange(NamedTuple):
+    """
+    Неизменяемый диапазон зарплат с целочисленными границами.
+
+    Граница None означает, что она не указана (для вакансии) или не ограничена (для фильтра). Разобранные из строки
+    диапазоны кэшируются, поэтому один и тот же фильтр разбирается один раз и переиспользуется для всех вакансий.
+    """
+
+    low: Union[int, None] = None
+    high: Union[int, None] = None
+
+    @staticmethod
+    def normalize(value) -> Union[int, None]:
+        """
+        Приводит значение зарплаты к целому числу.
+
+        :param value: Значение зарплаты: число, строка с числом, None или 'Не указано'.
+        :return: Целое число или None, если зарплата не указана.
+        """
+
+        if isinstance(value, bool):
+            return None
+
+        if isinstance(value, int):
+            return value
+
+        try:
+            return int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse(text: str) -> 'SalaryRange':
+        """
+        Разбирает диапазон зарплат из строки вида '100000 - 150000'.
+
+        Любая из границ может быть опущена ('100000 -', '- 150000'), пустая строка задаёт неограниченный диапазон.
+
+        :param text: Строка с диапазоном зарплат.
+        :return: Экземпляр SalaryRange.
+        """
+
+        low, _, high = text.partition('-')
+        low, high = low.strip(), high.strip()
+
+        return SalaryRange(int(low) if low else None, int(high) if high else None)
+
+    def contains(self, salary: 'SalaryRange') -> bool:
+        """
+        Проверяет, что зарплата вакансии укладывается в диапазон.
+
+        Минимальная зарплата вакансии должна быть не меньше нижней границы, а максимальная - не больше верхней.
+        Не указанные у вакансии значения не ограничивают её попадание в диапазон.
+
+        :param salary: Зарплата вакансии.
+        :return: True, если зарплата входит в диапазон, иначе False.
+        """
+
+        return ((self.low is None or salary.low is None or salary.low >= self.low)
+                and (self.high is None or salary.high is None or salary.high <= self.high))
+
+
 class JobVacancy:
     """
     Класс для представления информации о вакансии.
 
     Объект класса содержит информацию о названии вакансии, URL, зарплате и описании. Поддерживает сравнение вакансий
     по минимальной зарплате и форматированный вывод информации о вакансии.
+
+    Зарплата нормализуется один раз при создании объекта: атрибут salary хранит SalaryRange с целыми границами или None,
+    атрибут sort_key - целочисленный ключ сортировки (минимальная зарплата или 0). Сравнения и фильтрация по зарплате
+    работают только с этими значениями.
     """
 
     def __init__(self, title: str, url: str, salary_min: int = None, salary_max: int = None,
@@ -103,6 +245,8 @@ class JobVacancy:
         self.salary_min = self._validate_salary(salary_min)
         self.salary_max = self._validate_salary(salary_max)
         self.description = description
+        self.salary = SalaryRange(SalaryRange.normalize(salary_min), SalaryRange.normalize(salary_max))
+        self.sort_key = self.salary.low or 0
 
     @staticmethod
     def _validate_salary(salary: Union[int, None]) -> int:
@@ -137,48 +281,40 @@ class JobVacancy:
         :return: True, если минимальная зарплата текущей вакансии меньше, иначе False.
         """
 
-        self_salary_min = self.salary_min if type(self.salary_min) is int else 0
-        other_salary_min = other.salary_min if type(other.salary_min) is int else 0
-
-        return self_salary_min < other_salary_min
+        return self.sort_key < other.sort_key
 
-    def __le__(self, other: str) -> bool:
+    def __le__(self, other: Union[str, int]) -> bool:
         """
         Определяет, меньше или равна ли максимальная зарплата текущей вакансии, чем у другой.
 
         :param other: Цена для сравнения.
-        :return: True, если максимальная зарплата текущей вакансии меньше или равна, иначе False.
+        :return: True, если максимальная зарплата текущей вакансии меньше или равна либо не указана, иначе False.
         """
 
-        if self.salary_max is not int:
-            return True
-
-        return self.salary_max <= int(other)
+        return SalaryRange(high=int(other)).contains(self.salary)
 
-    def __ge__(self, other: str) -> bool:
+    def __ge__(self, other: Union[str, int]) -> bool:
         """
         Определяет, больше или равна ли минимальная зарплата текущей вакансии, чем у другой.
 
         :param other: Цена для сравнения.
-        :return: True, если минимальная зарплата текущей вакансии больше или равна, иначе False.
+        :return: True, если минимальная зарплата текущей вакансии больше или равна либо не указана, иначе False.
         """
 
-        if self.salary_min is not int:
-            return True
+        return SalaryRange(low=int(other)).contains(self.salary)
 
-        return self.salary_min >= int(other)
-
-    def comparison_salary(self, other: str) -> bool:
+    def comparison_salary(self, other: Union[str, SalaryRange]) -> bool:
         """
         Определяет, входит ли вакансия в заданный диапазон цен.
 
-        :param other: Заданный диапазон цен.
+        :param other: Заданный диапазон цен: строка вида '100000 - 150000' или SalaryRange.
         :return: True, если зарплата текущей вакансии в заданном диапазоне, иначе False.
         """
 
-        min_salary, max_salary = other.split(' - ')
+        if isinstance(other, str):
+            other = SalaryRange.parse(other)
 
-        return min_salary <= self <= max_salary
+        return other.contains(self.salary)
 
     def __repr__(self) -> str:
         """
@@ -206,6 +342,9 @@ class JSONVacancyStorage(VacancyStorage):
 
     Атрибуты:
         - filename (str): Путь к файлу JSON, используемому для хранения данных о вакансиях.
+        - compression (str): Алгоритм сжатия файла ('gzip', 'zstd') или None.
+        - compact (bool): Сохранять JSON без отступов.
+        - indexed (bool): Читать файл через memory-map и индекс смещений записей (см. MappedVacancyIndex).
 
     Методы:
         - add_vacancy(vacancy_data): Добавляет новую вакансию в хранилище.
@@ -213,14 +352,25 @@ class JSONVacancyStorage(VacancyStorage):
         - delete_vacancies(search_criteria): Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
     """
 
-    def __init__(self, filename: str) -> None:
+    extension = '.json'
+
+    def __init__(self, filename: str, compression: str = None, compact: bool = False, indexed: bool = False) -> None:
         """
         Инициализирует экземпляр класса JSONVacancyStorage.
 
         :param filename: Путь к JSON-файлу для хранения данных о вакансиях.
+        :param compression: Алгоритм сжатия ('gzip' или 'zstd'). По умолчанию определяется по расширению файла
+                            ('.gz', '.zst').
+        :param compact: Если True, JSON сохраняется без отступов и лишних пробелов.
+        :param indexed: Если True, get_vacancies декодирует только записи-кандидаты через memory-map. Для сжатых файлов
+                        не используется.
         """
 
         self.filename = filename
+        self.compression = compression or detect_compression(filename)
+        self.compact = compact
+        self.indexed = indexed and self.compression is None
+        self._index = MappedVacancyIndex(filename, jsonl=False) if self.indexed else None
 
     def add_vacancy(self, vacancy_data: dict) -> None:
         """
@@ -229,41 +379,64 @@ class JSONVacancyStorage(VacancyStorage):
         :param vacancy_data: Словарь с данными о вакансии для добавления.
         """
 
-        try:
-            data = self._load_data()
-        except FileNotFoundError:
-            data = []
-        except json.decoder.JSONDecodeError:
-            data = []
+        with writer_lock(self.filename):
+            try:
+                data = self._load_data()
+            except FileNotFoundError:
+                data = []
+            except json.decoder.JSONDecodeError:
+                data = []
 
-        data.append(vacancy_data)
-        self._save_data(data)
+            data.append(vacancy_data)
+            self._save_data(data)
 
-    def get_vacancies(self, search_criteria: dict) -> list:
+    def get_vacancies(self, search_criteria: Union[dict, Query]) -> list:
         """
         Возвращает список вакансий, соответствующих заданным критериям поиска.
 
-        :param search_criteria: Словарь с критериями для поиска вакансий.
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
         :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
         """
 
-        data = self._load_data()
-        result = [vacancy for vacancy in data if all(vacancy.get(key) == value for key, value in
-                                                     search_criteria.items())]
+        if self.indexed:
+            return self._index.get_vacancies(search_criteria)
+
+        predicate = as_query(search_criteria).compile()
+        result = [vacancy for vacancy in self._load_data() if predicate(vacancy)]
 
         return result
 
-    def delete_vacancies(self, search_criteria: dict) -> None:
+    def delete_vacancies(self, search_criteria: Union[dict, Query]) -> None:
         """
         Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
 
-        :param search_criteria: Словарь с критериями для поиска и удаления вакансий.
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        """
+
+        predicate = as_query(search_criteria).compile()
+
+        with writer_lock(self.filename):
+            data = [vacancy for vacancy in self._load_data() if not predicate(vacancy)]
+            self._save_data(data)
+
+    def _iter_data(self) -> Iterator[dict]:
+        """
+        Последовательно читает вакансии из json файла.
+
+        Несжатый файл читается по одной записи через индекс смещений (MappedVacancyIndex), поэтому в памяти не
+        находится весь массив. Сжатый файл загружается целиком: стандартный модуль json не умеет разбирать массив
+        потоково.
+
+        :return: Итератор словарей вакансий.
         """
 
-        data = self._load_data()
-        data = [vacancy for vacancy in data if not all(vacancy.get(key) == value for key, value in
-                                                       search_criteria.items())]
-        self._save_data(data)
+        if self.compression is not None:
+            yield from self._load_data()
+            return
+
+        index = self._index if self._index is not None else MappedVacancyIndex(self.filename, jsonl=False)
+
+        yield from index
 
     def _load_data(self) -> list:
         """
@@ -272,18 +445,146 @@ class JSONVacancyStorage(VacancyStorage):
         :return: Список вакансий, сохраненных в файлах (в формате словарей).
         """
 
-        with open(self.filename, 'r', encoding='utf-8') as file:
+        with open_compressed(self.filename, 'r', self.compression, encoding='utf-8') as file:
             return json.load(file)
 
     def _save_data(self, data: list) -> None:
         """
-        Сохраняет данные в json файл.
+        Атомарно сохраняет данные в json файл через временный файл.
 
         :param data: Список вакансий (в формате словарей) для сохранения.
         """
 
-        with open(self.filename, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+        with atomic_open(self.filename, 'w', self.compression, encoding='utf-8') as file:
+            if self.compact:
+                json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(data, file, ensure_ascii=False, indent=4)
+
+
+class JSONLVacancyStorage(VacancyStorage):
+    """
+    Класс для хранения информации о вакансиях в формате JSON Lines (одна вакансия - одна строка JSON).
+
+    В отличие от JSONVacancyStorage, добавление вакансии дописывает строку в конец файла без чтения хранилища, а поиск и
+    удаление обрабатывают файл построчно, не загружая его целиком в память. Поддерживается потоковое сжатие gzip и
+    zstd: дописывание в сжатый файл создаёт новый фрейм, который корректно читается вместе с предыдущими.
+
+    Атрибуты:
+        - filename (str): Путь к файлу JSONL, используемому для хранения данных о вакансиях.
+        - compression (str): Алгоритм сжатия файла ('gzip', 'zstd') или None.
+        - indexed (bool): Читать файл через memory-map и индекс смещений записей (см. MappedVacancyIndex).
+
+    Методы:
+        - add_vacancy(vacancy_data): Добавляет новую вакансию в хранилище.
+        - add_vacancies(vacancies_data): Добавляет список вакансий одной записью в конец файла.
+        - get_vacancies(search_criteria): Возвращает список вакансий, соответствующих заданным критериям поиска.
+        - delete_vacancies(search_criteria): Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
+    """
+
+    extension = '.jsonl'
+
+    def __init__(self, filename: str, compression: str = None, indexed: bool = False) -> None:
+        """
+        Инициализирует экземпляр класса JSONLVacancyStorage.
+
+        :param filename: Путь к JSONL-файлу для хранения данных о вакансиях.
+        :param compression: Алгоритм сжатия ('gzip' или 'zstd'). По умолчанию определяется по расширению файла
+                            ('.gz', '.zst').
+        :param indexed: Если True, get_vacancies декодирует только записи-кандидаты через memory-map. Для сжатых файлов
+                        не используется.
+        """
+
+        self.filename = filename
+        self.compression = compression or detect_compression(filename)
+        self.indexed = indexed and self.compression is None
+        self._index = MappedVacancyIndex(filename, jsonl=True) if self.indexed else None
+
+    def add_vacancy(self, vacancy_data: dict) -> None:
+        """
+        Дописывает новую вакансию в конец хранилища.
+
+        :param vacancy_data: Словарь с данными о вакансии для добавления.
+        """
+
+        self.add_vacancies([vacancy_data])
+
+    def add_vacancies(self, vacancies_data: list) -> None:
+        """
+        Дописывает список вакансий в конец хранилища за одну операцию записи.
+
+        :param vacancies_data: Список словарей с данными о вакансиях для добавления.
+        """
+
+        if not vacancies_data:
+            return
+
+        lines = ''.join(json.dumps(vacancy, ensure_ascii=False) + '\n' for vacancy in vacancies_data)
+
+        with writer_lock(self.filename):
+            with open_compressed(self.filename, 'a', self.compression, encoding='utf-8') as file:
+                file.write(lines)
+
+    def get_vacancies(self, search_criteria: Union[dict, Query]) -> list:
+        """
+        Возвращает список вакансий, соответствующих заданным критериям поиска.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
+        """
+
+        if self.indexed:
+            return self._index.get_vacancies(search_criteria)
+
+        predicate = as_query(search_criteria).compile()
+
+        return [vacancy for vacancy in self._iter_data() if predicate(vacancy)]
+
+    def delete_vacancies(self, search_criteria: Union[dict, Query]) -> None:
+        """
+        Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
+
+        Оставшиеся вакансии построчно переписываются во временный файл, который затем атомарно заменяет хранилище.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        """
+
+        predicate = as_query(search_criteria).compile()
+
+        with writer_lock(self.filename):
+            self._save_data(vacancy for vacancy in self._iter_data() if not predicate(vacancy))
+
+    def _iter_data(self) -> Iterator[dict]:
+        """
+        Построчно читает вакансии из jsonl файла.
+
+        :return: Итератор словарей вакансий.
+        """
+
+        with open_compressed(self.filename, 'r', self.compression, encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _load_data(self) -> list:
+        """
+        Загружает данные из jsonl файла.
+
+        :return: Список вакансий, сохраненных в файлах (в формате словарей).
+        """
+
+        return list(self._iter_data())
+
+    def _save_data(self, data: Iterable[dict]) -> None:
+        """
+        Атомарно сохраняет данные в jsonl файл через временный файл.
+
+        :param data: Итерируемый набор вакансий (в формате словарей) для сохранения.
+        """
+
+        with atomic_open(self.filename, 'w', self.compression, encoding='utf-8') as file:
+            for vacancy in data:
+                file.write(json.dumps(vacancy, ensure_ascii=False) + '\n')
 
 
 class CSVVacancyStorage(VacancyStorage):
@@ -294,6 +595,7 @@ class CSVVacancyStorage(VacancyStorage):
 
     Атрибуты:
         - filename (str): Путь к файлу CSV, используемому для хранения данных о вакансиях.
+        - compression (str): Алгоритм сжатия файла ('gzip', 'zstd') или None.
 
     Методы:
         - add_vacancy(vacancy_data): Добавляет новую вакансию в хранилище.
@@ -301,14 +603,19 @@ class CSVVacancyStorage(VacancyStorage):
         - delete_vacancies(search_criteria): Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
     """
 
-    def __init__(self, filename: str) -> None:
+    extension = '.csv'
+
+    def __init__(self, filename: str, compression: str = None) -> None:
         """
         Инициализирует экземпляр класса CSvVacancyStorage.
 
         :param filename: Путь к CSV-файлу для хранения данных о вакансиях.
+        :param compression: Алгоритм сжатия ('gzip' или 'zstd'). По умолчанию определяется по расширению файла
+                            ('.gz', '.zst').
         """
 
         self.filename = filename
+        self.compression = compression or detect_compression(filename)
 
     def add_vacancy(self, vacancy_data: dict) -> None:
         """
@@ -317,41 +624,54 @@ class CSVVacancyStorage(VacancyStorage):
         :param vacancy_data: Словарь с данными о вакансии для добавления.
         """
 
-        try:
-            data = self._load_data()
-        except FileNotFoundError:
-            data = []
-        except json.decoder.JSONDecodeError:
-            data = []
+        with writer_lock(self.filename):
+            try:
+                data = self._load_data()
+            except FileNotFoundError:
+                data = []
+            except json.decoder.JSONDecodeError:
+                data = []
 
-        data.append(vacancy_data)
-        self._save_data(data)
+            data.append(vacancy_data)
+            self._save_data(data)
 
-    def get_vacancies(self, search_criteria: dict) -> list:
+    def get_vacancies(self, search_criteria: Union[dict, Query]) -> list:
         """
         Возвращает список вакансий, соответствующих заданным критериям поиска.
 
-        :param search_criteria: Словарь с критериями для поиска вакансий.
+        Строки файла фильтруются по мере чтения, в память попадают только подходящие вакансии.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
         :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
         """
 
-        data = self._load_data()
-        result = [vacancy for vacancy in data if all(vacancy.get(key) == value for key, value in
-                                                     search_criteria.items())]
+        predicate = as_query(search_criteria).compile()
 
-        return result
+        with open_compressed(self.filename, 'r', self.compression, newline='', encoding='utf-8') as csvfile:
+            return [vacancy for vacancy in csv.DictReader(csvfile) if predicate(vacancy)]
 
-    def delete_vacancies(self, search_criteria: dict) -> None:
+    def delete_vacancies(self, search_criteria: Union[dict, Query]) -> None:
         """
         Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
 
-        :param search_criteria: Словарь с критериями для поиска и удаления вакансий.
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
         """
 
-        data = self._load_data()
-        data = [vacancy for vacancy in data if not all(vacancy.get(key) == value for key, value in
-                                                       search_criteria.items())]
-        self._save_data(data)
+        predicate = as_query(search_criteria).compile()
+
+        with writer_lock(self.filename):
+            data = [vacancy for vacancy in self._load_data() if not predicate(vacancy)]
+            self._save_data(data)
+
+    def _iter_data(self) -> Iterator[dict]:
+        """
+        Построчно читает вакансии из csv файла.
+
+        :return: Итератор словарей вакансий.
+        """
+
+        with open_compressed(self.filename, 'r', self.compression, newline='', encoding='utf-8') as csvfile:
+            yield from csv.DictReader(csvfile)
 
     def _load_data(self) -> list:
         """
@@ -360,19 +680,19 @@ class CSVVacancyStorage(VacancyStorage):
         :return: Список вакансий, сохраненных в файлах (в формате словарей).
         """
 
-        with open(self.filename, newline='', encoding='utf-8') as csvfile:
+        with open_compressed(self.filename, 'r', self.compression, newline='', encoding='utf-8') as csvfile:
             return list(csv.DictReader(csvfile))
 
     def _save_data(self, data: list) -> None:
         """
-        Сохраняет данные в csv файл.
+        Атомарно сохраняет данные в csv файл через временный файл.
 
         :param data: Список вакансий (в формате словарей) для сохранения.
         """
 
         keys = data[0].keys() if data else []
 
-        with open(self.filename, 'w', newline='', encoding='utf-8') as file:
+        with atomic_open(self.filename, 'w', self.compression, newline='', encoding='utf-8') as file:
             writer = csv.DictWriter(file, fieldnames=keys)
             writer.writeheader()
             writer.writerows(data)
@@ -382,68 +702,101 @@ class TXTVacancyStorage(VacancyStorage):
     """
     Класс для хранения информации о вакансиях в формате TXT.
 
-    Этот класс поддерживает добавление, поиск и удаление вакансий в хранилище, представленном JSON-файлом.
+    Каждая вакансия записывается отдельной читаемой строкой вида 'title: ...<TAB>url: ...<TAB>salary_min: ...'.
+    Табуляция, перевод строки и обратная косая черта экранируются (\\t, \\n, \\\\), двоеточие в названиях полей -
+    как \\c. Нестроковые значения (числа, None) записываются в нотации JSON и при чтении восстанавливаются с исходным
+    типом. Строки записываются как есть, кроме строк, которые сами читаются как значение JSON ('2024', 'null', '"a"'):
+    они записываются в кавычках JSON, чтобы не превратиться при чтении в число или None.
+
+    Добавление вакансии дописывает строку в конец файла без его чтения. Поиск выполняется по индексу байтовых
+    смещений строк (MappedVacancyIndex) через memory-map, а удаление переписывает файл построчно, поэтому память
+    не зависит от размера отчёта.
 
     Атрибуты:
         - filename (str): Путь к файлу TXT, используемому для хранения данных о вакансиях.
 
     Методы:
         - add_vacancy(vacancy_data): Добавляет новую вакансию в хранилище.
+        - add_vacancies(vacancies_data): Добавляет список вакансий одной записью в конец файла.
         - get_vacancies(search_criteria): Возвращает список вакансий, соответствующих заданным критериям поиска.
         - delete_vacancies(search_criteria): Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
     """
 
+    extension = '.txt'
+    escapes = {'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'}
+    unescapes = {'\\\\': '\\', '\\t': '\t', '\\n': '\n', '\\r': '\r', '\\c': ':'}
+
     def __init__(self, filename: str) -> None:
         """
-        Инициализирует экземпляр класса JSONVacancyStorage.
+        Инициализирует экземпляр класса TXTVacancyStorage.
 
-        :param filename: Путь к JSON-файлу для хранения данных о вакансиях.
+        :param filename: Путь к TXT-файлу для хранения данных о вакансиях.
         """
 
         self.filename = filename
+        self._index = MappedVacancyIndex(filename, jsonl=True, decoder=self._parse_record,
+                                         encoder=self._value_needles)
 
-    def add_vacancy(self, vacancy_data: list) -> None:
+    def add_vacancy(self, vacancy_data: dict) -> None:
         """
-        Добавляет новую вакансию в хранилище.
+        Дописывает новую вакансию в конец хранилища.
 
-        :param vacancy_data: Список с данными о вакансии для добавления.
+        :param vacancy_data: Словарь с данными о вакансии для добавления.
         """
 
-        try:
-            data = self._load_data()
-        except FileNotFoundError:
-            data = []
-        except json.decoder.JSONDecodeError:
-            data = []
+        self.add_vacancies([vacancy_data])
 
-        data.append(vacancy_data)
-        self._save_data(data)
+    def add_vacancies(self, vacancies_data: Iterable[dict]) -> None:
+        """
+        Дописывает список вакансий в конец хранилища за одну операцию записи.
 
-    def get_vacancies(self, search_criteria: dict) -> list:
+        :param vacancies_data: Итерируемый набор словарей с данными о вакансиях для добавления.
+        """
+
+        lines = ''.join(self._format_record(vacancy) + '\n' for vacancy in vacancies_data)
+
+        if not lines:
+            return
+
+        with writer_lock(self.filename):
+            with open(self.filename, 'a', encoding='utf-8') as file:
+                file.write(lines)
+
+    def get_vacancies(self, search_criteria: Union[dict, Query]) -> list:
         """
         Возвращает список вакансий, соответствующих заданным критериям поиска.
 
-        :param search_criteria: Словарь с критериями для поиска вакансий.
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
         :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
         """
 
-        data = self._load_data()
-        result = [vacancy for vacancy in data if all(vacancy.get(key) == value for key, value in
-                                                     search_criteria.items())]
+        return self._index.get_vacancies(search_criteria)
 
-        return result
-
-    def delete_vacancies(self, search_criteria: dict) -> None:
+    def delete_vacancies(self, search_criteria: Union[dict, Query]) -> None:
         """
         Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
 
-        :param search_criteria: Словарь с критериями для поиска и удаления вакансий.
+        Оставшиеся вакансии построчно переписываются во временный файл, который затем атомарно заменяет хранилище.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        """
+
+        predicate = as_query(search_criteria).compile()
+
+        with writer_lock(self.filename):
+            self._save_data(vacancy for vacancy in self._iter_data() if not predicate(vacancy))
+
+    def _iter_data(self) -> Iterator[dict]:
+        """
+        Построчно читает вакансии из txt файла.
+
+        :return: Итератор словарей вакансий.
         """
 
-        data = self._load_data()
-        data = [vacancy for vacancy in data if not all(vacancy.get(key) == value for key, value in
-                                                       search_criteria.items())]
-        self._save_data(data)
+        with open(self.filename, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    yield self._parse_record(line)
 
     def _load_data(self) -> list:
         """
@@ -452,19 +805,133 @@ class TXTVacancyStorage(VacancyStorage):
         :return: Список вакансий, сохраненных в файлах (в формате словарей).
         """
 
-        with open(self.filename, 'r', encoding='utf-8') as file:
-            return [line.strip() for line in file.readline()]
+        return list(self._iter_data())
 
-    def _save_data(self, data: list) -> None:
+    def _save_data(self, data: Iterable[dict]) -> None:
         """
-        Сохраняет данные в txt файл.
+        Атомарно сохраняет данные в txt файл через временный файл.
 
-        :param data: Список вакансий (в формате словарей) для сохранения.
+        :param data: Итерируемый набор вакансий (в формате словарей) для сохранения.
         """
 
-        with open(self.filename, 'w', encoding='utf-8') as file:
+        with atomic_open(self.filename, 'w', encoding='utf-8') as file:
             for vacancy in data:
-                file.write(str(vacancy) + '\n')
+                file.write(self._format_record(vacancy) + '\n')
+
+    @classmethod
+    def _format_record(cls, vacancy: dict) -> str:
+        """
+        Преобразует вакансию в строку файла.
+
+        :param vacancy: Словарь с данными о вакансии.
+        :return: Строка без завершающего перевода строки.
+        """
+
+        return '\t'.join(f"{cls._escape_key(key)}: {cls._format_value(value)}" for key, value in vacancy.items())
+
+    @classmethod
+    def _parse_record(cls, line: bytes) -> dict:
+        """
+        Восстанавливает вакансию из строки файла.
+
+        :param line: Строка файла в байтах.
+        :return: Словарь с данными о вакансии.
+        """
+
+        vacancy = {}
+
+        for field in line.decode('utf-8').rstrip('\r\n').split('\t'):
+            key, _, value = field.partition(': ')
+            vacancy[cls._unescape(key)] = cls._parse_value(value)
+
+        return vacancy
+
+    @classmethod
+    def _format_value(cls, value) -> str:
+        """
+        Преобразует значение поля в текст: строки записываются как есть, остальные значения - в нотации JSON.
+
+        Строка, которая при чтении была бы распознана как значение JSON, записывается в кавычках JSON.
+
+        :param value: Значение поля.
+        :return: Экранированный текст значения.
+        """
+
+        if isinstance(value, str):
+            text = cls._escape(value)
+            parsed = cls._parse_value(text)
+
+            if isinstance(parsed, str) and parsed == value:
+                return text
+
+            return cls._escape(json.dumps(value, ensure_ascii=False))
+
+        return cls._escape(json.dumps(value, ensure_ascii=False, default=str))
+
+    @classmethod
+    def _parse_value(cls, text: str):
+        """
+        Восстанавливает значение поля из текста.
+
+        :param text: Экранированный текст значения.
+        :return: Число, None, логическое значение, список, словарь или строка в кавычках, если текст является таким
+                 значением JSON, иначе строка.
+        """
+
+        value = cls._unescape(text)
+
+        if value and value[0] in '-0123456789[{ntf"':
+            try:
+                return json.loads(value)
+            except json.decoder.JSONDecodeError:
+                pass
+
+        return value
+
+    @classmethod
+    def _value_needles(cls, value) -> set:
+        """
+        Возвращает байтовое представление значения в файле для предварительного поиска по индексу.
+
+        :param value: Значение поля.
+        :return: Множество из одной байтовой строки.
+        """
+
+        return {cls._format_value(value).encode('utf-8')}
+
+    @classmethod
+    def _escape(cls, text: str) -> str:
+        """
+        Экранирует символы, разделяющие поля и строки файла.
+
+        :param text: Исходный текст.
+        :return: Экранированный текст.
+        """
+
+        return re.sub(r'[\\\t\n\r]', lambda match: cls.escapes[match.group()], text)
+
+    @classmethod
+    def _escape_key(cls, key) -> str:
+        """
+        Экранирует название поля. Помимо символов, экранируемых _escape, двоеточие заменяется на \\c, чтобы название
+        не содержало разделителя ': ' между названием и значением.
+
+        :param key: Название поля.
+        :return: Экранированное название.
+        """
+
+        return cls._escape(str(key)).replace(':', '\\c')
+
+    @classmethod
+    def _unescape(cls, text: str) -> str:
+        """
+        Восстанавливает текст, экранированный методом _escape.
+
+        :param text: Экранированный текст.
+        :return: Исходный текст.
+        """
+
+        return re.sub(r'\\[\\tnrc]', lambda match: cls.unescapes[match.group()], text)
 
 
 class XLSXVacancyStorage(VacancyStorage):
@@ -482,6 +949,8 @@ class XLSXVacancyStorage(VacancyStorage):
         - delete_vacancies(search_criteria): Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
     """
 
+    extension = '.xlsx'
+
     def __init__(self, filename: str) -> None:
         """
         Инициализирует экземпляр класса JSONVacancyStorage.
@@ -498,41 +967,43 @@ class XLSXVacancyStorage(VacancyStorage):
         :param vacancy_data: Список с данными о вакансии для добавления.
         """
 
-        try:
-            data = self._load_data()
-        except FileNotFoundError:
-            data = []
-        except json.decoder.JSONDecodeError:
-            data = []
+        with writer_lock(self.filename):
+            try:
+                data = self._load_data()
+            except FileNotFoundError:
+                data = []
+            except json.decoder.JSONDecodeError:
+                data = []
 
-        data.append(vacancy_data)
-        self._save_data(data)
+            data.append(vacancy_data)
+            self._save_data(data)
 
-    def get_vacancies(self, search_criteria: dict) -> list:
+    def get_vacancies(self, search_criteria: Union[dict, Query]) -> list:
         """
         Возвращает список вакансий, соответствующих заданным критериям поиска.
 
-        :param search_criteria: Словарь с критериями для поиска вакансий.
+        Условие вычисляется по столбцам DataFrame, в словари преобразуются только подходящие строки.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
         :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
         """
 
-        data = self._load_data()
-        result = [vacancy for vacancy in data if all(vacancy.get(key) == value for key, value in
-                                                     search_criteria.items())]
+        data_frame = pd.read_excel(self.filename)
+        mask = as_query(search_criteria).to_mask(data_frame)
 
-        return result
+        return data_frame[mask].to_dict('records')
 
-    def delete_vacancies(self, search_criteria: dict) -> None:
+    def delete_vacancies(self, search_criteria: Union[dict, Query]) -> None:
         """
         Удаляет вакансии, соответствующие заданным критериям поиска, из хранилища.
 
-        :param search_criteria: Словарь с критериями для поиска и удаления вакансий.
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
         """
 
-        data = self._load_data()
-        data = [vacancy for vacancy in data if not all(vacancy.get(key) == value for key, value in
-                                                       search_criteria.items())]
-        self._save_data(data)
+        with writer_lock(self.filename):
+            data_frame = pd.read_excel(self.filename)
+            mask = as_query(search_criteria).to_mask(data_frame)
+            self._save_data(data_frame[~mask].to_dict('records'))
 
     def _load_data(self) -> list:
         """
@@ -547,10 +1018,280 @@ class XLSXVacancyStorage(VacancyStorage):
 
     def _save_data(self, data: list) -> None:
         """
-        Сохраняет данные в xlsx файл.
+        Атомарно сохраняет данные в xlsx файл через временный файл.
 
         :param data: Список вакансий (в формате словарей) для сохранения.
         """
 
         data_frame = pd.DataFrame(data)
-        data_frame.to_excel(self.filename, index=False)
+
+        with atomic_path(self.filename) as tmp_path:
+            data_frame.to_excel(tmp_path, index=False)
+
+
+class PartitionedVacancyStorage(VacancyStorage):
+    """
+    Класс для хранения большого архива вакансий, разбитого на шарды.
+
+    Каждый шард - отдельный файл, обслуживаемый одним из файловых хранилищ (JSONVacancyStorage, CSVVacancyStorage и
+    т.д.). Вакансии распределяются по шардам по хешу URL или по дате публикации. Рядом с шардами хранится манифест
+    (manifest.json) со статистикой по каждому шарду: количество вакансий, минимальная и максимальная зарплата. Манифест
+    позволяет не открывать шарды, которые заведомо не подходят под критерии поиска или диапазон зарплат. Статистика
+    шарда обновляется под той же блокировкой, что и сам шард, поэтому манифест не отстаёт от содержимого шардов при
+    одновременной записи.
+
+    Атрибуты:
+        - directory (str): Директория с файлами шардов и манифестом.
+        - storage_class (type): Класс хранилища, используемый для каждого шарда.
+        - partition_by (str): Способ разбиения: 'url' или 'date'.
+        - shards (int): Количество шардов при разбиении по хешу URL.
+        - max_workers (int): Количество потоков для параллельного чтения шардов.
+
+    Методы:
+        - add_vacancy(vacancy_data): Добавляет новую вакансию в соответствующий шард.
+        - add_vacancies(vacancies_data): Добавляет список вакансий, записывая каждый шард один раз.
+        - get_vacancies(search_criteria, salary_range): Возвращает вакансии из шардов, которые могут подходить под
+          критерии.
+        - delete_vacancies(search_criteria, salary_range): Удаляет вакансии из подходящих шардов.
+    """
+
+    partition_fields = {'url': 'url', 'date': 'published_at'}
+    manifest_name = 'manifest.json'
+
+    def __init__(self, directory: str, storage_class: type = JSONVacancyStorage, partition_by: str = 'url',
+                 shards: int = 16, max_workers: int = 4) -> None:
+        """
+        Инициализирует экземпляр класса PartitionedVacancyStorage.
+
+        :param directory: Директория для файлов шардов (создаётся при необходимости).
+        :param storage_class: Класс хранилища для отдельного шарда (по умолчанию JSONVacancyStorage).
+        :param partition_by: Способ разбиения вакансий: 'url' - по хешу URL, 'date' - по полю published_at (или по
+                             текущей дате, если поле отсутствует).
+        :param shards: Количество шардов при разбиении по хешу URL.
+        :param max_workers: Количество потоков для параллельного чтения шардов.
+        """
+
+        if partition_by not in self.partition_fields:
+            raise ValueError(f"Неизвестный способ разбиения: {partition_by}")
+
+        self.directory = directory
+        self.storage_class = storage_class
+        self.partition_by = partition_by
+        self.shards = shards
+        self.max_workers = max_workers
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def add_vacancy(self, vacancy_data: dict) -> None:
+        """
+        Добавляет новую вакансию в соответствующий шард и обновляет статистику в манифесте.
+
+        :param vacancy_data: Словарь с данными о вакансии для добавления.
+        """
+
+        self.add_vacancies([vacancy_data])
+
+    def add_vacancies(self, vacancies_data: list) -> None:
+        """
+        Добавляет список вакансий, группируя их по шардам, чтобы каждый шард перезаписывался только один раз.
+
+        :param vacancies_data: Список словарей с данными о вакансиях для добавления.
+        """
+
+        groups = {}
+
+        for vacancy in vacancies_data:
+            groups.setdefault(self._shard_key(vacancy), []).append(vacancy)
+
+        for key, vacancies in groups.items():
+            storage = self._shard_storage(key)
+
+            with writer_lock(storage.filename):
+                try:
+                    data = storage._load_data()
+                except (FileNotFoundError, json.decoder.JSONDecodeError):
+                    data = []
+
+                data.extend(vacancies)
+                storage._save_data(data)
+                self._update_manifest(key, vacancies)
+
+    def get_vacancies(self, search_criteria: Union[dict, Query], salary_range: tuple = None) -> list:
+        """
+        Возвращает список вакансий, соответствующих заданным критериям поиска и диапазону зарплат.
+
+        Шарды, которые по манифесту не могут содержать подходящих вакансий, не читаются. Оставшиеся шарды читаются
+        параллельно.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        :param salary_range: Кортеж (минимальная, максимальная) зарплата или None.
+        :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
+        """
+
+        search_criteria = as_query(search_criteria)
+        keys = self._matching_shards(search_criteria, salary_range)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            shard_results = executor.map(lambda key: self._shard_storage(key).get_vacancies(search_criteria), keys)
+
+        result = []
+
+        for vacancies in shard_results:
+            result.extend(vacancy for vacancy in vacancies if self._salary_in_range(vacancy, salary_range))
+
+        return result
+
+    def delete_vacancies(self, search_criteria: Union[dict, Query], salary_range: tuple = None) -> None:
+        """
+        Удаляет вакансии, соответствующие заданным критериям поиска, из подходящих шардов и пересчитывает манифест.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        :param salary_range: Кортеж (минимальная, максимальная) зарплата или None.
+        """
+
+        search_criteria = as_query(search_criteria)
+        predicate = search_criteria.compile()
+
+        for key in self._matching_shards(search_criteria, salary_range):
+            storage = self._shard_storage(key)
+
+            with writer_lock(storage.filename):
+                data = [vacancy for vacancy in storage._load_data()
+                        if not (predicate(vacancy) and self._salary_in_range(vacancy, salary_range))]
+                storage._save_data(data)
+                self._update_manifest(key, data, replace=True)
+
+    def load_manifest(self) -> dict:
+        """
+        Загружает манифест со статистикой по шардам.
+
+        :return: Словарь вида {ключ шарда: {'count': ..., 'salary_min': ..., 'salary_max': ...}}.
+        """
+
+        try:
+            with open(os.path.join(self.directory, self.manifest_name), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _shard_key(self, vacancy: dict) -> str:
+        """
+        Определяет ключ шарда для вакансии.
+
+        :param vacancy: Словарь с данными о вакансии.
+        :return: Ключ шарда, пригодный для использования в имени файла.
+        """
+
+        match self.partition_by:
+            case 'url':
+                bucket = zlib.crc32(str(vacancy.get('url', '')).encode('utf-8')) % self.shards
+                return f"url-{bucket:04d}"
+            case 'date':
+                published_at = vacancy.get('published_at') or date.today().isoformat()
+                return f"date-{str(published_at)[:10]}"
+
+    def _shard_storage(self, key: str) -> VacancyStorage:
+        """
+        Создаёт хранилище для шарда с заданным ключом.
+
+        :param key: Ключ шарда.
+        :return: Экземпляр storage_class, указывающий на файл шарда.
+        """
+
+        return self.storage_class(os.path.join(self.directory, key + self.storage_class.extension))
+
+    def _matching_shards(self, search_criteria: Union[dict, Query], salary_range: tuple = None) -> list:
+        """
+        Отбирает шарды, которые могут содержать вакансии, подходящие под критерии.
+
+        Если критерии содержат поле, по которому выполнено разбиение, сразу вычисляется единственный нужный шард.
+        Шарды, диапазон зарплат которых не пересекается с salary_range, отбрасываются.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        :param salary_range: Кортеж (минимальная, максимальная) зарплата или None.
+        :return: Список ключей шардов.
+        """
+
+        manifest = self.load_manifest()
+        keys = [key for key, stats in manifest.items() if stats['count']]
+        partition_field = self.partition_fields[self.partition_by]
+        equalities = as_query(search_criteria).equalities()
+
+        if partition_field in equalities:
+            target = self._shard_key(equalities)
+            keys = [key for key in keys if key == target]
+
+        if salary_range is not None:
+            low, high = salary_range
+            keys = [key for key in keys if manifest[key]['salary_min'] is not None
+                    and manifest[key]['salary_max'] >= low and manifest[key]['salary_min'] <= high]
+
+        return sorted(keys)
+
+    def _update_manifest(self, key: str, vacancies: list, replace: bool = False) -> None:
+        """
+        Обновляет статистику шарда в манифесте. Вызывается под writer_lock файла шарда: блокировки всегда берутся в
+        порядке «шард, затем манифест».
+
+        :param key: Ключ шарда.
+        :param vacancies: Добавленные вакансии либо, при replace=True, полное содержимое шарда.
+        :param replace: Если True, статистика шарда пересчитывается с нуля.
+        """
+
+        manifest_path = os.path.join(self.directory, self.manifest_name)
+
+        with writer_lock(manifest_path):
+            manifest = self.load_manifest()
+            stats = {'count': 0, 'salary_min': None, 'salary_max': None}
+
+            if not replace:
+                stats = manifest.get(key, stats)
+
+            salaries = [salary for vacancy in vacancies for salary in self._numeric_salaries(vacancy)]
+
+            if stats['salary_min'] is not None:
+                salaries.extend([stats['salary_min'], stats['salary_max']])
+
+            manifest[key] = {'count': stats['count'] + len(vacancies),
+                             'salary_min': min(salaries) if salaries else None,
+                             'salary_max': max(salaries) if salaries else None}
+
+            with atomic_open(manifest_path, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def _numeric_salaries(vacancy: dict) -> list:
+        """
+        Возвращает числовые значения зарплаты вакансии, отбрасывая 'Не указано' и пустые значения.
+
+        :param vacancy: Словарь с данными о вакансии.
+        :return: Список из нуля, одного или двух целых чисел.
+        """
+
+        salaries = []
+
+        for field in ('salary_min', 'salary_max'):
+            try:
+                salaries.append(int(vacancy.get(field)))
+            except (TypeError, ValueError):
+                pass
+
+        return salaries
+
+    @classmethod
+    def _salary_in_range(cls, vacancy: dict, salary_range: tuple = None) -> bool:
+        """
+        Проверяет, что все указанные зарплаты вакансии лежат в заданном диапазоне.
+
+        :param vacancy: Словарь с данными о вакансии.
+        :param salary_range: Кортеж (минимальная, максимальная) зарплата или None.
+        :return: True, если диапазон не задан или зарплата вакансии указана и входит в него, иначе False.
+        """
+
+        if salary_range is None:
+            return True
+
+        salaries = cls._numeric_salaries(vacancy)
+        low, high = salary_range
+
+        return bool(salaries) and low <= min(salaries) and max(salaries) <= high
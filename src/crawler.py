@@ -0,0 +1,262 @@
+import json
+import os
+import queue
+import threading
+from datetime import datetime, timedelta
+
+from src.classes import HHVacancyService, JSONLVacancyStorage
+from src.file_io import atomic_open
+from src.rate_limit import AdaptiveRateLimiter, RateLimiter
+
+
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+class CrawlScheduler:
+    """
+    Планировщик полного обхода результатов поиска hh.ru.
+
+    API hh.ru отдаёт не более max_depth вакансий на один запрос, поэтому поиск разбивается на подзапросы по регионам и
+    временным окнам публикации. Если подзапрос находит больше max_depth вакансий, его окно делится пополам, пока это
+    возможно. Подзапросы выполняются пулом потоков с общим ограничителем частоты запросов, вакансии дедуплицируются по
+    id и по мере получения дописываются в JSONL-файл.
+
+    Очередь невыполненных подзапросов сохраняется в файл состояния после каждого изменения. При повторном запуске с тем
+    же файлом состояния обход продолжается с оставшихся подзапросов, а id уже сохранённых вакансий считываются из
+    выходного файла. Продолжить можно только тот же обход: поисковый запрос и регионы (а также окно публикации, если
+    оно задано явно) должны совпадать с сохранёнными, иначе run завершается ошибкой ValueError.
+
+    Атрибуты:
+        - service (HHVacancyService): Сервис для запросов к API.
+        - search_query (str): Текст поискового запроса.
+        - output (JSONLVacancyStorage): Хранилище найденных вакансий.
+        - state_file (str): Путь к файлу с очередью подзапросов.
+        - workers (int): Количество потоков.
+        - truncated (list): Подзапросы, которые не удалось разбить до max_depth вакансий.
+        - failed (list): Подзапросы, завершившиеся ошибкой после всех попыток.
+    """
+
+    per_page = 100
+    max_depth = 2000
+    max_attempts = 3
+    min_window = timedelta(minutes=10)
+
+    def __init__(self, search_query: str, output_file: str, areas: tuple = ("113",), date_from: datetime = None,
+                 date_to: datetime = None, state_file: str = None, workers: int = 4,
+                 service: HHVacancyService = None, rate_limiter: RateLimiter = None) -> None:
+        """
+        Инициализирует экземпляр класса CrawlScheduler.
+
+        :param search_query: Текст поискового запроса.
+        :param output_file: Путь к JSONL-файлу для найденных вакансий.
+        :param areas: Идентификаторы регионов поиска (по умолчанию 113 - Россия).
+        :param date_from: Начало окна публикации (по умолчанию 30 дней назад).
+        :param date_to: Конец окна публикации (по умолчанию текущий момент).
+        :param state_file: Путь к файлу состояния (по умолчанию '<output_file>.state').
+        :param workers: Количество потоков.
+        :param service: Сервис для запросов к API (по умолчанию HHVacancyService с общим rate_limiter).
+        :param rate_limiter: Ограничитель частоты запросов (по умолчанию AdaptiveRateLimiter).
+        """
+
+        self._explicit_window = date_from is not None or date_to is not None
+        date_to = date_to or datetime.now().replace(microsecond=0)
+        date_from = date_from or date_to - timedelta(days=30)
+
+        self.search_query = search_query
+        self.service = service or HHVacancyService(rate_limiter=rate_limiter or AdaptiveRateLimiter())
+        self.output = JSONLVacancyStorage(output_file)
+        self.state_file = state_file or output_file + '.state'
+        self.workers = workers
+        self.truncated = []
+        self.failed = []
+        self._initial = [{"area": area, "date_from": date_from.strftime(DATE_FORMAT),
+                          "date_to": date_to.strftime(DATE_FORMAT), "attempt": 0} for area in areas]
+        self._queue = queue.Queue()
+        self._pending = []
+        self._seen_ids = set()
+        self._lock = threading.Lock()
+
+    def run(self) -> int:
+        """
+        Выполняет обход, продолжая его с сохранённого состояния, если оно есть.
+
+        :return: Количество новых вакансий, сохранённых за этот запуск.
+        """
+
+        tasks = self._load_state()
+
+        if tasks is None:
+            tasks = self._initial
+
+        self._seen_ids = self._load_seen_ids()
+        seen_before = len(self._seen_ids)
+
+        for task in tasks:
+            self._push(task)
+
+        self._save_state()
+        threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.workers)]
+
+        for thread in threads:
+            thread.start()
+
+        self._queue.join()
+
+        for _ in threads:
+            self._queue.put(None)
+
+        for thread in threads:
+            thread.join()
+
+        if not self._pending:
+            os.unlink(self.state_file)
+
+        return len(self._seen_ids) - seen_before
+
+    def _worker(self) -> None:
+        """
+        Обрабатывает подзапросы из очереди, пока не получит сигнал остановки (None).
+        """
+
+        while (task := self._queue.get()) is not None:
+            try:
+                self._process(task)
+            except Exception:
+                retry = dict(task, attempt=task['attempt'] + 1)
+
+                with self._lock:
+                    self._pending[self._pending.index(task)] = retry
+
+                    if retry['attempt'] < self.max_attempts:
+                        self._queue.put(retry)
+                    else:
+                        self.failed.append(retry)
+            else:
+                with self._lock:
+                    self._pending.remove(task)
+                    self._save_state()
+            finally:
+                self._queue.task_done()
+
+    def _process(self, task: dict) -> None:
+        """
+        Выполняет подзапрос: разбивает его, если результатов слишком много, иначе выгружает все страницы.
+
+        :param task: Подзапрос (area, date_from, date_to).
+        """
+
+        params = {"text": self.search_query, "area": task['area'], "date_from": task['date_from'],
+                  "date_to": task['date_to'], "per_page": self.per_page, "page": 0}
+        data = self.service.fetch_page(params)
+
+        if data['found'] > self.max_depth:
+            children = self._split(task)
+
+            if children:
+                with self._lock:
+                    for child in children:
+                        self._push(child)
+
+                return
+
+            with self._lock:
+                self.truncated.append(task)
+
+        self._store(data['items'])
+
+        for page in range(1, data['pages']):
+            self._store(self.service.fetch_page(dict(params, page=page))['items'])
+
+    def _split(self, task: dict) -> list:
+        """
+        Делит временное окно подзапроса пополам.
+
+        :param task: Подзапрос.
+        :return: Два дочерних подзапроса или пустой список, если окно уже не больше min_window.
+        """
+
+        date_from = datetime.strptime(task['date_from'], DATE_FORMAT)
+        date_to = datetime.strptime(task['date_to'], DATE_FORMAT)
+
+        if date_to - date_from <= self.min_window:
+            return []
+
+        middle = (date_from + (date_to - date_from) / 2).replace(microsecond=0)
+
+        return [dict(task, date_to=middle.strftime(DATE_FORMAT), attempt=0),
+                dict(task, date_from=middle.strftime(DATE_FORMAT), attempt=0)]
+
+    def _store(self, items: list) -> None:
+        """
+        Сохраняет ещё не встречавшиеся вакансии из ответа API.
+
+        Запись выполняется под блокировкой планировщика, а id отмечаются как сохранённые только после успешной записи:
+        если запись завершилась ошибкой, повторная попытка подзапроса сохранит эти вакансии.
+
+        :param items: Список вакансий в формате API.
+        """
+
+        with self._lock:
+            new_items = list({item['id']: item for item in items if item['id'] not in self._seen_ids}.values())
+            parsed = HHVacancyService._parse_vacancies(new_items)
+            self.output.add_vacancies([dict(vacancy, id=item['id']) for item, vacancy in zip(new_items, parsed)])
+            self._seen_ids.update(item['id'] for item in new_items)
+
+    def _push(self, task: dict) -> None:
+        """
+        Добавляет подзапрос в очередь и в список невыполненных.
+
+        :param task: Подзапрос.
+        """
+
+        self._pending.append(task)
+        self._queue.put(task)
+
+    def _load_state(self) -> list:
+        """
+        Загружает очередь невыполненных подзапросов из файла состояния.
+
+        Окно публикации сравнивается, только если оно задано явно: по умолчанию оно отсчитывается от текущего момента,
+        и при продолжении используется окно из файла состояния.
+
+        :return: Список подзапросов или None, если файла состояния нет.
+        """
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        initial, expected = state.get('initial', self._initial), self._initial
+
+        if not self._explicit_window:
+            initial = [dict(task, date_from=None, date_to=None) for task in initial]
+            expected = [dict(task, date_from=None, date_to=None) for task in expected]
+
+        if state.get('search_query') != self.search_query or initial != expected:
+            raise ValueError(f"Файл состояния {self.state_file} относится к другому обходу "
+                             f"(запрос '{state.get('search_query')}'); удалите его или укажите другой state_file")
+
+        return [dict(task, attempt=0) for task in state['pending']]
+
+    def _save_state(self) -> None:
+        """
+        Атомарно сохраняет очередь невыполненных подзапросов.
+        """
+
+        with atomic_open(self.state_file, 'w', encoding='utf-8') as file:
+            json.dump({"search_query": self.search_query, "initial": self._initial, "pending": self._pending}, file,
+                      ensure_ascii=False)
+
+    def _load_seen_ids(self) -> set:
+        """
+        Считывает id вакансий, уже сохранённых в выходной файл.
+
+        :return: Множество id вакансий.
+        """
+
+        try:
+            return {vacancy['id'] for vacancy in self.output.get_vacancies({}) if 'id' in vacancy}
+        except FileNotFoundError:
+            return set()
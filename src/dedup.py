@@ -0,0 +1,194 @@
+import re
+import zlib
+from typing import Iterable
+
+import numpy as np
+
+from src.classes import JobVacancy
+
+
+MERSENNE_PRIME = (1 << 31) - 1
+NON_WORD = re.compile(r'\W+')
+
+
+def shingles(text: str, size: int = 5) -> np.ndarray:
+    """
+    Разбивает текст на символьные шинглы и хеширует их.
+
+    Текст приводится к нижнему регистру, знаки препинания и повторные пробелы заменяются одним пробелом, поэтому
+    «Python-разработчик» и «python разработчик» дают одинаковые шинглы. Текст короче size становится одним шинглом.
+
+    :param text: Исходный текст.
+    :param size: Длина шингла в символах.
+    :return: Массив уникальных 32-битных хешей шинглов (пустой для пустого текста).
+    """
+
+    text = NON_WORD.sub(' ', text.lower()).strip()
+
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+
+    hashes = {zlib.crc32(text[i:i + size].encode('utf-8')) for i in range(max(len(text) - size, 0) + 1)}
+
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+class MinHashLSH:
+    """
+    Поиск почти одинаковых вакансий по MinHash-сигнатурам с LSH-индексом.
+
+    Для каждой вакансии по шинглам названия и описания строится сигнатура из num_perm минимальных хешей; доля совпавших
+    позиций двух сигнатур оценивает коэффициент Жаккара их множеств шинглов. Сигнатура делится на bands полос, и
+    вакансии с совпадающей полосой попадают в одну корзину. Оценка сходства вычисляется только для пар внутри корзин,
+    поэтому время работы растёт примерно линейно с количеством вакансий, а не квадратично.
+
+    Атрибуты:
+        - threshold (float): Минимальное оценённое сходство, при котором вакансии считаются дубликатами.
+        - num_perm (int): Длина сигнатуры.
+        - bands (int): Количество полос LSH (num_perm должно делиться на bands).
+        - shingle_size (int): Длина шингла в символах.
+
+    Методы:
+        - signatures(texts): Строит MinHash-сигнатуры текстов.
+        - clusters(texts): Группирует почти одинаковые тексты.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, bands: int = 32, shingle_size: int = 5,
+                 seed: int = 1) -> None:
+        """
+        Инициализирует экземпляр класса MinHashLSH.
+
+        :param threshold: Минимальное сходство дубликатов (от 0 до 1).
+        :param num_perm: Длина сигнатуры.
+        :param bands: Количество полос LSH. Больше полос - больше кандидатов на проверку и меньше пропусков.
+        :param shingle_size: Длина шингла в символах.
+        :param seed: Начальное значение генератора хеш-функций; одинаковое значение даёт одинаковые сигнатуры.
+        """
+
+        if num_perm % bands:
+            raise ValueError("num_perm должно делиться на bands без остатка")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = generator.integers(0, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+    def signatures(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Строит MinHash-сигнатуры текстов хеш-функциями вида (a * x + b) mod p.
+
+        :param texts: Итерируемый набор текстов.
+        :return: Массив формы (количество текстов, num_perm). Строка текста без шинглов заполнена значением p.
+        """
+
+        rows = []
+
+        for text in texts:
+            hashes = shingles(text, self.shingle_size) % MERSENNE_PRIME
+
+            if len(hashes):
+                rows.append(((self._a * hashes + self._b) % MERSENNE_PRIME).min(axis=1))
+            else:
+                rows.append(np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint64))
+
+        return np.array(rows, dtype=np.uint64).reshape(len(rows), self.num_perm)
+
+    def clusters(self, texts: Iterable[str]) -> list:
+        """
+        Группирует почти одинаковые тексты.
+
+        Внутри корзины каждый текст сравнивается с первым текстом корзины, и при сходстве не ниже threshold их кластеры
+        объединяются (система непересекающихся множеств). Пустые тексты ни с чем не объединяются.
+
+        :param texts: Итерируемый набор текстов.
+        :return: Список кластеров - списков порядковых номеров текстов по возрастанию; кластеры упорядочены по
+                 первому элементу.
+        """
+
+        signatures = self.signatures(texts)
+        parents = list(range(len(signatures)))
+        empty = (signatures == MERSENNE_PRIME).all(axis=1)
+        rows = self.num_perm // self.bands
+
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+
+            return index
+
+        for band in range(self.bands):
+            buckets = {}
+
+            for index, key in enumerate(signatures[:, band * rows:(band + 1) * rows]):
+                if not empty[index]:
+                    buckets.setdefault(key.tobytes(), []).append(index)
+
+            for head, *members in buckets.values():
+                for member in members:
+                    head_root, member_root = find(head), find(member)
+
+                    if head_root == member_root:
+                        continue
+
+                    if self.similarity(signatures[head], signatures[member]) >= self.threshold:
+                        parents[max(head_root, member_root)] = min(head_root, member_root)
+
+        clusters = {}
+
+        for index in range(len(signatures)):
+            clusters.setdefault(find(index), []).append(index)
+
+        return list(clusters.values())
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """
+        Оценивает коэффициент Жаккара по двум сигнатурам.
+
+        :param first: Первая сигнатура.
+        :param second: Вторая сигнатура.
+        :return: Доля совпадающих позиций.
+        """
+
+        return float(np.mean(first == second))
+
+
+def vacancy_text(vacancy: JobVacancy) -> str:
+    """
+    Возвращает текст вакансии, по которому определяется сходство: название и описание.
+
+    :param vacancy: Объект вакансии.
+    :return: Строка с названием и описанием.
+    """
+
+    return f"{vacancy.title} {vacancy.description}"
+
+
+def representative_indices(vacancies: list, threshold: float = 0.7) -> list:
+    """
+    Находит по одной вакансии из каждой группы почти одинаковых вакансий.
+
+    Представителем группы становится вакансия, встретившаяся в списке первой.
+
+    :param vacancies: Список объектов JobVacancy (например, результат utils.initialize_job_vacancy).
+    :param threshold: Минимальное сходство, при котором вакансии считаются дубликатами.
+    :return: Порядковые номера представителей по возрастанию.
+    """
+
+    return [cluster[0] for cluster in MinHashLSH(threshold).clusters(vacancy_text(vacancy) for vacancy in vacancies)]
+
+
+def deduplicate_vacancies(vacancies: list, threshold: float = 0.7) -> list:
+    """
+    Удаляет почти одинаковые вакансии, оставляя по одной из каждой группы в исходном порядке.
+
+    :param vacancies: Список объектов JobVacancy.
+    :param threshold: Минимальное сходство, при котором вакансии считаются дубликатами.
+    :return: Список объектов вакансий без дубликатов.
+    """
+
+    return [vacancies[index] for index in representative_indices(vacancies, threshold)]
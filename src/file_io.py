@@ -0,0 +1,191 @@
+import gzip
+import io
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+
+def detect_compression(filename: str) -> Union[str, None]:
+    """
+    Определяет алгоритм сжатия по расширению файла.
+
+    :param filename: Путь к файлу.
+    :return: 'gzip', 'zstd' или None, если файл не сжат.
+    """
+
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def open_compressed(filename: str, mode: str = 'r', compression: str = None, **kwargs) -> IO:
+    """
+    Открывает файл с потоковым сжатием или распаковкой.
+
+    Поддерживаются gzip (стандартная библиотека) и zstd (требует установленного пакета zstandard). Без сжатия файл
+    открывается обычным open.
+
+    :param filename: Путь к файлу.
+    :param mode: Режим открытия ('r', 'w', 'a', в том числе с 'b' или 't').
+    :param compression: 'gzip', 'zstd' или None.
+    :param kwargs: Дополнительные аргументы для open (encoding, newline и т.д.).
+    :return: Файловый объект.
+    """
+
+    match compression:
+        case None:
+            return open(filename, mode, **kwargs)
+        case 'gzip':
+            if 'b' not in mode and 't' not in mode:
+                mode += 't'
+
+            return gzip.open(filename, mode, **kwargs)
+        case 'zstd':
+            if zstandard is None:
+                raise ImportError("Для сжатия zstd необходимо установить пакет zstandard")
+
+            if 'r' in mode:
+                return _open_zstd_reader(filename, mode, **kwargs)
+
+            if 'b' not in mode and 't' not in mode:
+                mode += 't'
+
+            return zstandard.open(filename, mode, **kwargs)
+        case _:
+            raise ValueError(f"Неизвестный алгоритм сжатия: {compression}")
+
+
+def _open_zstd_reader(filename: str, mode: str, **kwargs) -> IO:
+    """
+    Открывает zstd-файл на чтение через все его фреймы.
+
+    Каждое дописывание в сжатый файл создаёт новый фрейм, а zstandard.open по умолчанию останавливает чтение после
+    первого из них, поэтому поток распаковки создаётся явно с read_across_frames=True.
+
+    :param filename: Путь к файлу.
+    :param mode: Режим открытия ('r' или 'rb').
+    :param kwargs: Дополнительные аргументы для текстового режима (encoding, errors, newline).
+    :return: Файловый объект.
+    """
+
+    reader = zstandard.ZstdDecompressor().stream_reader(open(filename, 'rb'), read_across_frames=True, closefd=True)
+
+    if 'b' in mode:
+        return reader
+
+    return io.TextIOWrapper(reader, **kwargs)
+
+
+@contextmanager
+def writer_lock(filename: str) -> Iterator[None]:
+    """
+    Захватывает эксклюзивную рекомендательную блокировку (fcntl.flock) для записи в файл хранилища.
+
+    Блокировка ставится на отдельный файл '<filename>.lock', а не на сам файл данных: при атомарной записи файл данных
+    подменяется через os.replace, и блокировка на нём потеряла бы смысл. Читатели блокировку не захватывают - благодаря
+    атомарной подмене они всегда видят либо старую, либо новую версию файла целиком. На платформах без fcntl
+    блокировка не выполняется.
+
+    :param filename: Путь к файлу хранилища.
+    """
+
+    with open(filename + '.lock', 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def atomic_path(filename: str) -> Iterator[str]:
+    """
+    Предоставляет путь к временному файлу, который после успешной записи атомарно заменяет целевой файл.
+
+    Временный файл создаётся в той же директории, что и целевой (os.replace атомарен только в пределах одной файловой
+    системы), и сохраняет его расширение, чтобы библиотеки вроде pandas могли определить формат. Перед подменой данные
+    временного файла сбрасываются на диск (fsync), после подмены - запись директории, поэтому падение процесса или
+    системы посреди записи не повреждает существующий файл. Если при записи возникло исключение, временный файл
+    удаляется, а исходный файл остаётся нетронутым.
+
+    :param filename: Путь к целевому файлу.
+    :return: Путь к временному файлу для записи.
+    """
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    suffix = os.path.splitext(filename)[1]
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(filename) + '.', suffix=suffix)
+    os.close(fd)
+
+    try:
+        yield tmp_path
+
+        if os.path.exists(filename):
+            shutil.copymode(filename, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+
+        _fsync(tmp_path)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    _fsync(directory)
+
+
+def _fsync(path: str) -> None:
+    """
+    Сбрасывает на диск содержимое файла или запись директории.
+
+    На платформах, где директорию нельзя открыть (Windows), сброс директории пропускается.
+
+    :param path: Путь к файлу или директории.
+    """
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (IsADirectoryError, PermissionError):
+        return
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_open(filename: str, mode: str = 'w', compression: str = None, **kwargs) -> Iterator[IO]:
+    """
+    Открывает временный файл на запись и атомарно подменяет им целевой файл после закрытия.
+
+    Перед подменой данные сбрасываются на диск (fsync, см. atomic_path), поэтому падение процесса посреди записи не
+    повреждает существующее хранилище.
+
+    :param filename: Путь к целевому файлу.
+    :param mode: Режим открытия файла (по умолчанию 'w').
+    :param compression: 'gzip', 'zstd' или None (см. open_compressed).
+    :param kwargs: Дополнительные аргументы для open (encoding, newline и т.д.).
+    :return: Файловый объект для записи.
+    """
+
+    with atomic_path(filename) as tmp_path:
+        with open_compressed(tmp_path, mode, compression, **kwargs) as file:
+            yield file
@@ -0,0 +1,400 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Callable, Iterator, Union
+
+import numpy as np
+
+from src.file_io import atomic_open
+from src.query import Query, as_query
+
+
+HEADER_DTYPE = np.dtype([('version', '<u8'), ('size', '<u8'), ('mtime_ns', '<u8'), ('inode', '<u8')])
+INDEX_HEADER_DTYPE = np.dtype(HEADER_DTYPE.descr + [('prefix_hash', '<u8')])
+PREFIX_BLOCK = 4096
+OFFSET_DTYPE = np.dtype([('start', '<u8'), ('end', '<u8')])
+JSON_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]', re.DOTALL)
+
+
+class MappedVacancyIndex:
+    """
+    Индекс байтовых смещений записей в несжатом JSON или JSONL файле хранилища.
+
+    Файл хранилища отображается в память (mmap), а смещения начала и конца каждой вакансии хранятся в файле
+    '<filename>.idx'. При выборке сначала выполняется дешёвый байтовый поиск строковых и целочисленных значений из
+    условий на равенство по всему отображённому буферу, и декодируются только записи, в которые попали совпадения.
+    Индекс перестраивается, если файл хранилища изменился; для JSONL, к которому только дописывались строки (тот же
+    inode и неизменная проиндексированная часть, см. _same_prefix), индексируется лишь новый хвост файла.
+
+    Построчный режим (jsonl=True) подходит для любого формата «одна запись - одна строка», если передать функции
+    декодирования записи и кодирования значений для байтового поиска (см. TXTVacancyStorage).
+
+    Атрибуты:
+        - filename (str): Путь к файлу хранилища.
+        - jsonl (bool): Формат файла - построчный (True) или JSON-массив (False).
+        - decoder (Callable): Функция, декодирующая байты записи в словарь вакансии.
+        - encoder (Callable): Функция, возвращающая возможные байтовые представления значения поля в файле.
+
+    Методы:
+        - get_vacancies(search_criteria): Возвращает вакансии, соответствующие критериям.
+        - __iter__(): Последовательно декодирует все вакансии.
+        - __getitem__(position): Декодирует одну вакансию по её порядковому номеру.
+    """
+
+    version = 2
+    suffix = '.idx'
+
+    def __init__(self, filename: str, jsonl: bool = None, decoder: Callable[[bytes], dict] = None,
+                 encoder: Callable[[object], set] = None) -> None:
+        """
+        Инициализирует экземпляр класса MappedVacancyIndex.
+
+        :param filename: Путь к несжатому JSON или JSONL файлу.
+        :param jsonl: Формат файла. По умолчанию определяется по расширению '.jsonl'.
+        :param decoder: Функция декодирования записи (по умолчанию json.loads).
+        :param encoder: Функция кодирования значения для байтового поиска (по умолчанию JSON-представление).
+        """
+
+        self.filename = filename
+        self.jsonl = filename.endswith('.jsonl') if jsonl is None else jsonl
+        self.decoder = decoder or json.loads
+        self.encoder = encoder or self.json_needles
+        self._offsets = np.empty(0, dtype=OFFSET_DTYPE)
+        self._stamp = None
+
+    def __len__(self) -> int:
+        with self._mapped() as (_, offsets):
+            return len(offsets)
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Последовательно декодирует все вакансии файла, не загружая их в память одновременно.
+
+        :return: Итератор словарей вакансий.
+        """
+
+        with self._mapped() as (buffer, offsets):
+            for offset in offsets:
+                yield self._decode(buffer, offset)
+
+    def __getitem__(self, position: int) -> dict:
+        """
+        Декодирует вакансию по её порядковому номеру в файле.
+
+        :param position: Порядковый номер вакансии.
+        :return: Словарь с данными о вакансии.
+        """
+
+        with self._mapped() as (buffer, offsets):
+            return self._decode(buffer, offsets[position])
+
+    def get_vacancies(self, search_criteria: Union[dict, Query]) -> list:
+        """
+        Возвращает вакансии, соответствующие критериям поиска, декодируя только записи-кандидаты.
+
+        :param search_criteria: Словарь с критериями на равенство или объект Query.
+        :return: Список вакансий (в формате словарей), соответствующих критериям поиска.
+        """
+
+        query = as_query(search_criteria)
+        predicate = query.compile()
+
+        with self._mapped() as (buffer, offsets):
+            if not len(offsets):
+                return []
+
+            candidates = self._candidates(buffer, offsets, query)
+
+            return [vacancy for vacancy in (self._decode(buffer, offsets[i]) for i in candidates)
+                    if predicate(vacancy)]
+
+    def _candidates(self, buffer: mmap.mmap, offsets: np.ndarray, query: Query) -> Iterator[int]:
+        """
+        Отбирает записи, содержащие байтовые представления всех значений из условий на равенство.
+
+        Предварительный поиск выполняется только для значений, запись которых в файле однозначна (см. _prefilterable).
+        Остальные условия проверяются только после декодирования.
+
+        :param buffer: Отображённый в память файл.
+        :param offsets: Смещения записей.
+        :param query: Условие выборки.
+        :return: Порядковые номера записей-кандидатов в порядке следования в файле.
+        """
+
+        candidates = None
+
+        for value in query.equalities().values():
+            if not self._prefilterable(value):
+                continue
+
+            positions = np.array([position for needle in self.encoder(value)
+                                  for position in self._find_all(buffer, needle)], dtype='<u8')
+            records = np.searchsorted(offsets['start'], positions, side='right') - 1
+            inside = (records >= 0) & (positions < offsets['end'][np.maximum(records, 0)])
+            records = set(records[inside].tolist())
+            candidates = records if candidates is None else candidates & records
+
+        if candidates is None:
+            return iter(range(len(offsets)))
+
+        return iter(sorted(candidates))
+
+    @staticmethod
+    def _prefilterable(value) -> bool:
+        """
+        Проверяет, можно ли искать значение в файле по байтовому представлению.
+
+        Подходят строки и целые числа, кроме 0 и 1. Представление None (в том числе отсутствующего поля), вещественных
+        чисел, списков и словарей зависит от отступов и разделителей, с которыми записан файл, а bool, 0 и 1 равны друг
+        другу при сравнении (True == 1), но записываются по-разному.
+
+        :param value: Значение из условия на равенство.
+        :return: True, если по значению можно отбирать записи-кандидаты.
+        """
+
+        return type(value) is str or type(value) is int and value not in (0, 1)
+
+    @staticmethod
+    def _find_all(buffer: mmap.mmap, needle: bytes) -> Iterator[int]:
+        """
+        Находит все вхождения байтовой строки в отображённом файле.
+
+        :param buffer: Отображённый в память файл.
+        :param needle: Искомая байтовая строка.
+        :return: Итератор смещений вхождений.
+        """
+
+        position = buffer.find(needle)
+
+        while position != -1:
+            yield position
+            position = buffer.find(needle, position + 1)
+
+    @staticmethod
+    def json_needles(value) -> set:
+        """
+        Возвращает возможные байтовые представления значения в JSON (с экранированием не-ASCII символов и без).
+
+        :param value: Значение поля.
+        :return: Множество байтовых строк.
+        """
+
+        return {json.dumps(value, ensure_ascii=False).encode('utf-8'), json.dumps(value).encode('utf-8')}
+
+    def _decode(self, buffer: mmap.mmap, offset: np.void) -> dict:
+        """
+        Декодирует одну запись из отображённого файла.
+
+        :param buffer: Отображённый в память файл.
+        :param offset: Смещения начала и конца записи.
+        :return: Словарь с данными о вакансии.
+        """
+
+        return self.decoder(buffer[int(offset['start']):int(offset['end'])])
+
+    @contextmanager
+    def _mapped(self) -> Iterator[tuple]:
+        """
+        Отображает файл хранилища в память только для чтения и возвращает смещения записей именно этой версии файла.
+
+        Файл открывается один раз: отметка для проверки индекса берётся через fstat того же дескриптора, а сканирование
+        и декодирование выполняются по одному отображению. Если писатель атомарно подменит файл, чтение продолжится по
+        старой версии, и смещения не разойдутся с содержимым.
+
+        :return: Кортеж (отображённый файл, массив смещений с типом OFFSET_DTYPE).
+        """
+
+        with open(self.filename, 'rb') as file:
+            stat = os.fstat(file.fileno())
+
+            if stat.st_size == 0:
+                yield b'', self._refresh(b'', stat)
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer, self._refresh(buffer, stat)
+
+    def _refresh(self, buffer: Union[mmap.mmap, bytes], stat: os.stat_result) -> np.ndarray:
+        """
+        Возвращает актуальные смещения записей, при необходимости загружая или перестраивая индекс.
+
+        :param buffer: Отображённый в память файл.
+        :param stat: Результат fstat для того же открытого файла.
+        :return: Массив смещений с типом OFFSET_DTYPE.
+        """
+
+        stamp = (len(buffer), stat.st_mtime_ns, stat.st_ino)
+
+        if stamp == self._stamp:
+            return self._offsets
+
+        header, offsets = self._load_sidecar()
+
+        if header is not None and not self._same_prefix(buffer, stat, header):
+            header, offsets = None, None
+
+        if header is not None and self.jsonl:
+            tail, indexed_size = self._scan(buffer, int(header['size']))
+            offsets = np.concatenate([offsets, tail])
+        elif header is None or (header['size'], header['mtime_ns'], header['inode']) != stamp:
+            offsets, indexed_size = self._scan(buffer, 0)
+        else:
+            indexed_size = len(buffer)
+
+        if header is None or indexed_size != header['size'] or stamp[1:] != (header['mtime_ns'], header['inode']):
+            self._save_sidecar((indexed_size, stat.st_mtime_ns, stat.st_ino, self._prefix_hash(buffer, indexed_size)),
+                               offsets)
+
+        self._offsets, self._stamp = offsets, stamp
+
+        return offsets
+
+    @classmethod
+    def _same_prefix(cls, buffer: Union[mmap.mmap, bytes], stat: os.stat_result, header: np.void) -> bool:
+        """
+        Проверяет, что проиндексированная часть файла не изменилась.
+
+        Совпадения inode и того, что файл не стал короче, недостаточно: удаление переписывает файл атомарно, и новый
+        файл может получить inode, освободившийся ранее. Поэтому дополнительно сравнивается хеш первого и последнего
+        блоков проиндексированной части, сохранённый в заголовке индекса.
+
+        :param buffer: Отображённый в память файл.
+        :param stat: Результат fstat для того же открытого файла.
+        :param header: Заголовок индекса.
+        :return: True, если смещения из индекса можно применять к файлу.
+        """
+
+        size = int(header['size'])
+
+        if header['inode'] != stat.st_ino or size > len(buffer):
+            return False
+
+        return cls._prefix_hash(buffer, size) == header['prefix_hash']
+
+    @staticmethod
+    def _prefix_hash(buffer: Union[mmap.mmap, bytes], size: int) -> int:
+        """
+        Вычисляет 64-битный хеш первого и последнего блоков длиной PREFIX_BLOCK в первых size байтах файла.
+
+        :param buffer: Отображённый в память файл.
+        :param size: Длина проиндексированной части файла.
+        :return: Беззнаковое 64-битное целое.
+        """
+
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(buffer[:min(size, PREFIX_BLOCK)])
+        digest.update(buffer[max(size - PREFIX_BLOCK, 0):size])
+
+        return int.from_bytes(digest.digest(), 'little')
+
+    def _scan(self, buffer: Union[mmap.mmap, bytes], start: int) -> tuple:
+        """
+        Находит границы записей в файле, начиная с заданного смещения.
+
+        :param buffer: Отображённый в память файл.
+        :param start: Смещение, с которого начинается сканирование.
+        :return: Кортеж (массив смещений с типом OFFSET_DTYPE, смещение, до которого файл проиндексирован).
+        """
+
+        if len(buffer) <= start:
+            return np.empty(0, dtype=OFFSET_DTYPE), start
+
+        if self.jsonl:
+            return self._scan_lines(buffer, start)
+
+        return self._scan_array(buffer), len(buffer)
+
+    @staticmethod
+    def _scan_lines(buffer: mmap.mmap, start: int) -> tuple:
+        """
+        Находит границы строк JSONL файла.
+
+        Незавершённая последняя строка (без перевода строки) в индекс не попадает: её может дописывать другой процесс.
+
+        :param buffer: Отображённый в память файл.
+        :param start: Смещение, с которого начинается сканирование.
+        :return: Кортеж (массив смещений непустых строк, смещение после последней завершённой строки).
+        """
+
+        offsets = []
+
+        while (end := buffer.find(b'\n', start)) != -1:
+            if end > start:
+                offsets.append((start, end))
+
+            start = end + 1
+
+        return np.array(offsets, dtype=OFFSET_DTYPE), start
+
+    @staticmethod
+    def _scan_array(buffer: mmap.mmap) -> np.ndarray:
+        """
+        Находит границы объектов верхнего уровня внутри JSON-массива.
+
+        Строковые литералы пропускаются регулярным выражением целиком, поэтому скобки внутри строк не учитываются.
+
+        :param buffer: Отображённый в память файл.
+        :return: Массив смещений объектов.
+        """
+
+        offsets = []
+        depth = 0
+        start = 0
+
+        for match in JSON_TOKEN.finditer(buffer):
+            token = match.group()
+
+            if token in (b'{', b'['):
+                depth += 1
+
+                if depth == 2:
+                    start = match.start()
+            elif token in (b'}', b']'):
+                if depth == 2:
+                    offsets.append((start, match.end()))
+
+                depth -= 1
+
+        return np.array(offsets, dtype=OFFSET_DTYPE)
+
+    def _load_sidecar(self) -> tuple:
+        """
+        Загружает индекс из файла.
+
+        :return: Кортеж (заголовок, смещения) или (None, None), если файла нет или он другой версии.
+        """
+
+        path = self.filename + self.suffix
+
+        try:
+            data = np.fromfile(path, dtype=np.uint8)
+        except FileNotFoundError:
+            return None, None
+
+        if len(data) < INDEX_HEADER_DTYPE.itemsize:
+            return None, None
+
+        header = data[:INDEX_HEADER_DTYPE.itemsize].view(INDEX_HEADER_DTYPE)[0]
+
+        if header['version'] != self.version:
+            return None, None
+
+        return header, data[INDEX_HEADER_DTYPE.itemsize:].view(OFFSET_DTYPE)
+
+    def _save_sidecar(self, stamp: tuple, offsets: np.ndarray) -> None:
+        """
+        Атомарно сохраняет индекс в файл.
+
+        :param stamp: Размер проиндексированной части, время изменения и inode файла хранилища, а также хеш
+                      проиндексированной части (см. _prefix_hash).
+        :param offsets: Массив смещений.
+        """
+
+        header = np.array([(self.version, *stamp)], dtype=INDEX_HEADER_DTYPE)
+
+        with atomic_open(self.filename + self.suffix, 'wb') as file:
+            file.write(header.tobytes())
+            file.write(np.ascontiguousarray(offsets, dtype=OFFSET_DTYPE).tobytes())
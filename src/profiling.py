@@ -0,0 +1,252 @@
+import cProfile
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+
+
+PROFILE_FORMATS = ('pstats', 'collapsed')
+
+_active = None
+
+
+class StageStats(NamedTuple):
+    """
+    Показатели одного этапа: время выполнения, процессорное время и пиковый объём памяти, выделенной Python.
+    """
+
+    name: str
+    depth: int
+    wall: float
+    cpu: float
+    peak_memory: int
+
+
+class StackSampler:
+    """
+    Сэмплирующий профайлер: с заданным интервалом снимает стеки вызовов всех потоков процесса.
+
+    Результат сохраняется в формате collapsed stacks (одна строка 'поток;модуль:функция;... количество' на уникальный
+    стек), который понимают flamegraph.pl, speedscope и аналогичные инструменты. В отличие от cProfile, сэмплер почти
+    не замедляет программу и видит потоки пула.
+
+    Атрибуты:
+        - interval (float): Интервал между снимками в секундах.
+        - stacks (Counter): Количество снимков каждого стека.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """
+        Инициализирует экземпляр класса StackSampler.
+
+        :param interval: Интервал между снимками в секундах.
+        """
+
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Запускает поток сэмплирования.
+        """
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Останавливает поток сэмплирования.
+        """
+
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """
+        Снимает стеки, пока не будет вызван stop.
+        """
+
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """
+        Снимает текущие стеки вызовов всех потоков, кроме потока сэмплирования.
+        """
+
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == threading.get_ident():
+                continue
+
+            stack = []
+
+            while frame is not None:
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+                frame = frame.f_back
+
+            stack.append(names.get(thread_id, str(thread_id)))
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def dump(self, filename: str) -> None:
+        """
+        Сохраняет стеки в формате collapsed stacks.
+
+        :param filename: Путь к файлу.
+        """
+
+        with open(filename, 'w', encoding='utf-8') as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+class PipelineProfiler:
+    """
+    Профайлер запуска программы с поэтапной статистикой.
+
+    На время работы (контекстный менеджер) включается cProfile (формат 'pstats') или StackSampler (формат
+    'collapsed') и tracemalloc. Для каждого этапа, отмеченного через stage, запоминаются время выполнения,
+    процессорное время (без ожидания ввода пользователя и ответов сети) и пик памяти. Этапы могут быть вложенными.
+    При выходе из контекста профиль сохраняется в файл, в том числе если выполнение завершилось исключением.
+
+    cProfile учитывает только поток, в котором запущен профайлер; для записи файлов в пуле потоков используйте формат
+    'collapsed'.
+
+    Атрибуты:
+        - output_file (str): Путь к файлу профиля.
+        - output_format (str): 'pstats' или 'collapsed'.
+        - stages (list): Показатели завершённых этапов (StageStats) в порядке их начала.
+
+    Методы:
+        - stage(name): Контекстный менеджер, отмечающий этап.
+        - summary(): Возвращает таблицу с показателями этапов.
+    """
+
+    def __init__(self, output_file: str, output_format: str = 'pstats', interval: float = 0.005) -> None:
+        """
+        Инициализирует экземпляр класса PipelineProfiler.
+
+        :param output_file: Путь к файлу профиля.
+        :param output_format: 'pstats' (читается модулем pstats, snakeviz) или 'collapsed' (для flame graph).
+        :param interval: Интервал сэмплирования в секундах для формата 'collapsed'.
+        """
+
+        if output_format not in PROFILE_FORMATS:
+            raise ValueError(f"Допустимые форматы профиля: {', '.join(PROFILE_FORMATS)}")
+
+        self.output_file = output_file
+        self.output_format = output_format
+        self.stages = []
+        self._profiler = cProfile.Profile() if output_format == 'pstats' else StackSampler(interval)
+        self._open_peaks = []
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> 'PipelineProfiler':
+        global _active
+
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+        if self.output_format == 'pstats':
+            self._profiler.enable()
+        else:
+            self._profiler.start()
+
+        _active = self
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        global _active
+
+        _active = None
+
+        if self.output_format == 'pstats':
+            self._profiler.disable()
+            self._profiler.dump_stats(self.output_file)
+        else:
+            self._profiler.stop()
+            self._profiler.dump(self.output_file)
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Отмечает этап выполнения и собирает его показатели.
+
+        Пик памяти tracemalloc общий для процесса, поэтому перед началом вложенного этапа текущий пик сохраняется для
+        всех открытых этапов и сбрасывается; по завершении этапа его пик передаётся внешнему этапу.
+
+        :param name: Название этапа.
+        """
+
+        depth = len(self._open_peaks)
+        self._save_peak()
+        tracemalloc.reset_peak()
+        self._open_peaks.append(0)
+        position = len(self.stages)
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._save_peak()
+            peak_memory = self._open_peaks.pop()
+
+            if self._open_peaks:
+                self._open_peaks[-1] = max(self._open_peaks[-1], peak_memory)
+
+            self.stages.insert(position, StageStats(name, depth, wall, cpu, peak_memory))
+
+    def _save_peak(self) -> None:
+        """
+        Запоминает текущий пик памяти для всех открытых этапов.
+        """
+
+        peak = tracemalloc.get_traced_memory()[1]
+        self._open_peaks = [max(open_peak, peak) for open_peak in self._open_peaks]
+
+    def summary(self) -> str:
+        """
+        Возвращает таблицу с показателями этапов.
+
+        :return: Многострочная строка: этап, время, процессорное время и пик памяти в МБ.
+        """
+
+        lines = [f"{'Этап':<32}{'Время, с':>12}{'CPU, с':>12}{'Пик памяти, МБ':>18}"]
+
+        for stage in self.stages:
+            lines.append(f"{'  ' * stage.depth + stage.name:<32}{stage.wall:>12.3f}{stage.cpu:>12.3f}"
+                         f"{stage.peak_memory / 2 ** 20:>18.2f}")
+
+        lines.append(f"Профиль сохранён в {self.output_file} ({self.output_format})")
+
+        return '\n'.join(lines)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Отмечает этап выполнения в активном PipelineProfiler. Без активного профайлера ничего не делает.
+
+    :param name: Название этапа.
+    """
+
+    if _active is None:
+        yield
+        return
+
+    with _active.stage(name):
+        yield
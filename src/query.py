@@ -0,0 +1,281 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Union
+
+import pandas as pd
+
+
+class Query(ABC):
+    """
+    Абстрактный класс условия для выборки вакансий из хранилища.
+
+    Условия комбинируются операторами & (И) и | (ИЛИ). Каждое хранилище компилирует условие в наиболее удобную для
+    себя форму: файловые хранилища - в один Python-предикат (compile), хранилища на основе DataFrame - в булеву маску
+    по столбцам (to_mask).
+    """
+
+    @abstractmethod
+    def compile(self) -> Callable[[dict], bool]:
+        """
+        Компилирует условие в функцию-предикат над словарём вакансии.
+
+        :return: Функция, принимающая словарь вакансии и возвращающая True, если вакансия подходит.
+        """
+
+        pass
+
+    @abstractmethod
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        """
+        Вычисляет условие для всех строк DataFrame сразу.
+
+        :param data_frame: Таблица вакансий.
+        :return: Булева маска строк, удовлетворяющих условию.
+        """
+
+        pass
+
+    def equalities(self) -> dict:
+        """
+        Возвращает поля, значение которых однозначно зафиксировано условием на равенство.
+
+        Используется хранилищами для отсечения лишних данных (например, шардов) до чтения.
+
+        :return: Словарь {поле: значение}.
+        """
+
+        return {}
+
+    def matches(self, vacancy: dict) -> bool:
+        """
+        Проверяет, удовлетворяет ли вакансия условию.
+
+        :param vacancy: Словарь с данными о вакансии.
+        :return: True, если вакансия подходит, иначе False.
+        """
+
+        return self.compile()(vacancy)
+
+    def __and__(self, other: 'Query') -> 'And':
+        return And(self, other)
+
+    def __or__(self, other: 'Query') -> 'Or':
+        return Or(self, other)
+
+
+class Eq(Query):
+    """
+    Условие равенства поля заданному значению.
+    """
+
+    def __init__(self, field: str, value: Any) -> None:
+        """
+        :param field: Имя поля вакансии.
+        :param value: Ожидаемое значение поля.
+        """
+
+        self.field = field
+        self.value = value
+
+    def compile(self) -> Callable[[dict], bool]:
+        field, value = self.field, self.value
+
+        return lambda vacancy: vacancy.get(field) == value
+
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        if self.field not in data_frame.columns:
+            return pd.Series(self.value is None, index=data_frame.index)
+
+        return data_frame[self.field] == self.value
+
+    def equalities(self) -> dict:
+        return {self.field: self.value}
+
+
+class Range(Query):
+    """
+    Условие попадания числового значения поля в диапазон [low, high]. Любая из границ может быть опущена.
+
+    Значения, которые не удаётся привести к числу (например, 'Не указано'), условию не удовлетворяют.
+    """
+
+    def __init__(self, field: str, low: float = None, high: float = None) -> None:
+        """
+        :param field: Имя поля вакансии.
+        :param low: Нижняя граница (включительно) или None.
+        :param high: Верхняя граница (включительно) или None.
+        """
+
+        self.field = field
+        self.low = low
+        self.high = high
+
+    def compile(self) -> Callable[[dict], bool]:
+        field, low, high = self.field, self.low, self.high
+
+        def predicate(vacancy: dict) -> bool:
+            try:
+                value = float(vacancy.get(field))
+            except (TypeError, ValueError):
+                return False
+
+            return (low is None or value >= low) and (high is None or value <= high)
+
+        return predicate
+
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        if self.field not in data_frame.columns:
+            return pd.Series(False, index=data_frame.index)
+
+        values = pd.to_numeric(data_frame[self.field], errors='coerce')
+        mask = values.notna()
+
+        if self.low is not None:
+            mask &= values >= self.low
+
+        if self.high is not None:
+            mask &= values <= self.high
+
+        return mask
+
+
+class In(Query):
+    """
+    Условие принадлежности значения поля заданному набору.
+    """
+
+    def __init__(self, field: str, values: Union[list, set, tuple]) -> None:
+        """
+        :param field: Имя поля вакансии.
+        :param values: Допустимые значения поля.
+        """
+
+        self.field = field
+        self.values = frozenset(values)
+
+    def compile(self) -> Callable[[dict], bool]:
+        field, values = self.field, self.values
+
+        return lambda vacancy: vacancy.get(field) in values
+
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        if self.field not in data_frame.columns:
+            return pd.Series(None in self.values, index=data_frame.index)
+
+        return data_frame[self.field].isin(self.values)
+
+
+class Contains(Query):
+    """
+    Условие вхождения подстроки в текстовое значение поля (по умолчанию без учёта регистра).
+    """
+
+    def __init__(self, field: str, substring: str, case_sensitive: bool = False) -> None:
+        """
+        :param field: Имя поля вакансии.
+        :param substring: Искомая подстрока.
+        :param case_sensitive: Учитывать ли регистр.
+        """
+
+        self.field = field
+        self.substring = substring
+        self.case_sensitive = case_sensitive
+
+    def compile(self) -> Callable[[dict], bool]:
+        field = self.field
+
+        if self.case_sensitive:
+            substring = self.substring
+            return lambda vacancy: substring in str(vacancy.get(field) or '')
+
+        substring = self.substring.casefold()
+
+        return lambda vacancy: substring in str(vacancy.get(field) or '').casefold()
+
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        if self.field not in data_frame.columns:
+            return pd.Series(False, index=data_frame.index)
+
+        return data_frame[self.field].astype(str).str.contains(self.substring, case=self.case_sensitive,
+                                                               regex=False, na=False)
+
+
+class And(Query):
+    """
+    Логическое И нескольких условий. Пустое And истинно для любой вакансии.
+    """
+
+    def __init__(self, *queries: Query) -> None:
+        """
+        :param queries: Объединяемые условия.
+        """
+
+        self.queries = queries
+
+    def compile(self) -> Callable[[dict], bool]:
+        predicates = tuple(query.compile() for query in self.queries)
+
+        if len(predicates) == 1:
+            return predicates[0]
+
+        return lambda vacancy: all(predicate(vacancy) for predicate in predicates)
+
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        mask = pd.Series(True, index=data_frame.index)
+
+        for query in self.queries:
+            mask &= query.to_mask(data_frame)
+
+        return mask
+
+    def equalities(self) -> dict:
+        result = {}
+
+        for query in self.queries:
+            result.update(query.equalities())
+
+        return result
+
+
+class Or(Query):
+    """
+    Логическое ИЛИ нескольких условий. Пустое Or ложно для любой вакансии.
+    """
+
+    def __init__(self, *queries: Query) -> None:
+        """
+        :param queries: Объединяемые условия.
+        """
+
+        self.queries = queries
+
+    def compile(self) -> Callable[[dict], bool]:
+        predicates = tuple(query.compile() for query in self.queries)
+
+        if len(predicates) == 1:
+            return predicates[0]
+
+        return lambda vacancy: any(predicate(vacancy) for predicate in predicates)
+
+    def to_mask(self, data_frame: pd.DataFrame) -> pd.Series:
+        mask = pd.Series(False, index=data_frame.index)
+
+        for query in self.queries:
+            mask |= query.to_mask(data_frame)
+
+        return mask
+
+
+def as_query(search_criteria: Union[dict, Query]) -> Query:
+    """
+    Приводит критерии поиска к объекту Query.
+
+    Словарь критериев, как и раньше, трактуется как набор условий на равенство, объединённых через И.
+
+    :param search_criteria: Словарь с критериями поиска или готовый объект Query.
+    :return: Объект Query.
+    """
+
+    if isinstance(search_criteria, Query):
+        return search_criteria
+
+    return And(*(Eq(key, value) for key, value in search_criteria.items()))
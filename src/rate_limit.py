@@ -0,0 +1,212 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class RateLimiter:
+    """
+    Потокобезопасный ограничитель частоты запросов по алгоритму token bucket.
+
+    Корзина пополняется со скоростью rate токенов в секунду до ёмкости capacity. Каждый запрос забирает один токен;
+    если токенов нет, acquire ждёт их появления. Один экземпляр можно разделять между потоками, чтобы суммарная частота
+    запросов всех потоков не превышала rate.
+
+    Атрибуты:
+        - rate (float): Скорость пополнения корзины, запросов в секунду.
+        - capacity (float): Максимальное количество накопленных токенов (допустимый всплеск запросов).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        """
+        Инициализирует экземпляр класса RateLimiter.
+
+        :param rate: Допустимое количество запросов в секунду.
+        :param capacity: Ёмкость корзины.
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Забирает один токен, при необходимости ожидая пополнения корзины.
+        """
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        """
+        Сообщает ограничителю об успешном запросе. Фиксированный ограничитель эту информацию не использует.
+        """
+
+        pass
+
+    def on_throttle(self, retry_after: float = None) -> None:
+        """
+        Сообщает ограничителю, что сервер отклонил запрос из-за превышения частоты (HTTP 429 или captcha).
+        Фиксированный ограничитель эту информацию не использует.
+
+        :param retry_after: Рекомендованная сервером пауза в секундах (заголовок Retry-After), если она известна.
+        """
+
+        pass
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Ограничитель частоты запросов, подстраивающий скорость под ответы сервера по схеме AIMD.
+
+    После каждого успешного запроса скорость увеличивается на increase запросов в секунду (аддитивный рост) вплоть до
+    max_rate. Когда сервер отвечает 429, скорость умножается на decrease (мультипликативное снижение), но не опускается
+    ниже min_rate, а все запросы приостанавливаются на время Retry-After, если сервер его указал.
+
+    Состояние (скорость, токены, пауза) разделяется между потоками одного процесса. Если задан state_file, оно хранится
+    в этом файле под блокировкой fcntl и разделяется между всеми процессами, использующими тот же файл.
+
+    Атрибуты:
+        - rate (float): Текущая скорость, запросов в секунду (для state_file - значение на момент последнего обращения).
+        - min_rate (float): Минимальная скорость.
+        - max_rate (float): Максимальная скорость.
+        - increase (float): Прирост скорости после успешного запроса.
+        - decrease (float): Множитель скорости после ответа 429.
+        - state_file (str): Путь к файлу общего состояния или None.
+    """
+
+    def __init__(self, rate: float = 5, min_rate: float = 0.5, max_rate: float = 50, increase: float = 0.1,
+                 decrease: float = 0.5, capacity: float = 1, state_file: str = None) -> None:
+        """
+        Инициализирует экземпляр класса AdaptiveRateLimiter.
+
+        :param rate: Начальная скорость, запросов в секунду.
+        :param min_rate: Минимальная скорость.
+        :param max_rate: Максимальная скорость.
+        :param increase: Прирост скорости после успешного запроса.
+        :param decrease: Множитель скорости после ответа 429 (от 0 до 1).
+        :param capacity: Ёмкость корзины.
+        :param state_file: Файл для разделения состояния между процессами (по умолчанию состояние хранится в памяти).
+        """
+
+        super().__init__(rate, capacity)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.state_file = state_file
+        self._updated = time.time()
+        self._paused_until = 0.0
+
+    def acquire(self) -> None:
+        """
+        Забирает один токен, при необходимости ожидая пополнения корзины или окончания паузы после ответа 429.
+        """
+
+        while True:
+            with self._state() as state:
+                now = time.time()
+
+                if state['paused_until'] > now:
+                    delay = state['paused_until'] - now
+                else:
+                    state['tokens'] = min(self.capacity,
+                                          state['tokens'] + max(now - state['updated'], 0) * state['rate'])
+                    state['updated'] = now
+
+                    if state['tokens'] >= 1:
+                        state['tokens'] -= 1
+                        return
+
+                    delay = (1 - state['tokens']) / state['rate']
+
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        """
+        Увеличивает скорость на increase, не превышая max_rate.
+        """
+
+        with self._state() as state:
+            state['rate'] = min(self.max_rate, state['rate'] + self.increase)
+
+    def on_throttle(self, retry_after: float = None) -> None:
+        """
+        Уменьшает скорость в 1 / decrease раз, не опускаясь ниже min_rate, и сбрасывает накопленные токены.
+
+        Время пополнения корзины тоже сбрасывается на текущий момент: иначе следующий acquire начислил бы токены за всё
+        время ожидания отклонённого ответа, и снижение скорости почти не действовало бы.
+
+        :param retry_after: Рекомендованная сервером пауза в секундах; на это время приостанавливаются все запросы.
+        """
+
+        with self._state() as state:
+            state['rate'] = max(self.min_rate, state['rate'] * self.decrease)
+            state['tokens'] = 0
+            state['updated'] = time.time()
+
+            if retry_after:
+                state['paused_until'] = max(state['paused_until'], time.time() + retry_after)
+
+    @contextmanager
+    def _state(self) -> Iterator[dict]:
+        """
+        Предоставляет изменяемое состояние ограничителя под блокировкой.
+
+        Без state_file состояние хранится в атрибутах экземпляра и защищено threading.Lock. С state_file оно читается
+        из файла и записывается обратно под эксклюзивной блокировкой fcntl (и threading.Lock для потоков процесса).
+        Повреждённый или пустой файл трактуется как начальное состояние.
+
+        :return: Словарь с ключами rate, tokens, updated, paused_until.
+        """
+
+        with self._lock:
+            if self.state_file is None:
+                state = {'rate': self.rate, 'tokens': self._tokens, 'updated': self._updated,
+                         'paused_until': self._paused_until}
+                yield state
+                self.rate, self._tokens = state['rate'], state['tokens']
+                self._updated, self._paused_until = state['updated'], state['paused_until']
+                return
+
+            with open(self.state_file, 'a+', encoding='utf-8') as file:
+                if fcntl is not None:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+                try:
+                    file.seek(0)
+
+                    try:
+                        state = json.loads(file.read())
+                    except json.decoder.JSONDecodeError:
+                        state = {'rate': self.rate, 'tokens': self.capacity, 'updated': time.time(),
+                                 'paused_until': 0.0}
+
+                    yield state
+                    self.rate = state['rate']
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(state))
+                    file.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,316 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from operator import attrgetter
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from src.classes import HHVacancyService, JobVacancy
+from src.dedup import representative_indices
+from src.rate_limit import AdaptiveRateLimiter
+from src.utils import STORAGE_FORMATS, initialize_job_vacancy, filter_vacancies, export_vacancies
+
+
+class HTTPError(Exception):
+    """
+    Ошибка обработки запроса, которая возвращается клиенту с указанным HTTP-статусом.
+    """
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        """
+        :param status: HTTP-статус ответа.
+        :param message: Текст ошибки.
+        """
+
+        super().__init__(message)
+        self.status = status
+
+
+class VacancyServer:
+    """
+    HTTP/JSON сервис поиска вакансий, работающий в одном долгоживущем процессе.
+
+    Между запросами сохраняются HTTP-сессия HHVacancyService (пул соединений к api.hh.ru), кэш результатов поиска с
+    ограниченным временем жизни и размером и скомпилированные регулярные выражения для ключевых слов (см.
+    utils.keyword_matcher). Блокирующие операции (запросы к API, запись файлов) выполняются в пуле потоков, чтобы не
+    останавливать цикл событий.
+
+    Эндпоинты:
+        - GET /search?text=...: Вакансии по поисковому запросу.
+        - GET /filter?text=...&keywords=...&salary=...: Вакансии, отфильтрованные по ключевым словам и зарплате.
+        - GET /top?text=...&n=...&keywords=...&salary=...: Топ N отфильтрованных вакансий по зарплате.
+        - POST /export {"text", "formats", "filename"}: Сохранение вакансий в файлы одного или нескольких форматов
+          в директории export_dir.
+    """
+
+    def __init__(self, service: HHVacancyService = None, cache_ttl: float = 300, export_dir: str = 'data',
+                 cache_size: int = 1024, rate_limit_state: str = None) -> None:
+        """
+        Инициализирует экземпляр класса VacancyServer.
+
+        :param service: Сервис для запросов к API (по умолчанию HHVacancyService с AdaptiveRateLimiter).
+        :param cache_ttl: Время жизни закэшированного результата поиска в секундах.
+        :param export_dir: Директория для сохранения файлов через /export.
+        :param cache_size: Максимальное количество закэшированных поисковых запросов.
+        :param rate_limit_state: Файл состояния ограничителя частоты запросов для сервиса по умолчанию. Процессы с
+                                 одним файлом делят общую квоту запросов к API (по умолчанию состояние в памяти).
+        """
+
+        self.service = service or HHVacancyService(rate_limiter=AdaptiveRateLimiter(state_file=rate_limit_state))
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.export_dir = export_dir
+        self._cache = OrderedDict()
+        self._pending = {}
+
+    async def search(self, text: str) -> tuple:
+        """
+        Возвращает вакансии по поисковому запросу, используя кэш.
+
+        Одновременные запросы с одинаковым текстом ожидают один общий запрос к API.
+
+        :param text: Текст поискового запроса.
+        :return: Кортеж (список словарей вакансий, список объектов JobVacancy).
+        """
+
+        cached = self._cache.get(text)
+
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        if text not in self._pending:
+            self._pending[text] = asyncio.ensure_future(asyncio.to_thread(self._fetch, text))
+
+        try:
+            result = await asyncio.shield(self._pending[text])
+        finally:
+            self._pending.pop(text, None)
+
+        self._store(text, result)
+
+        return result
+
+    def _store(self, text: str, result: tuple) -> None:
+        """
+        Кэширует результат поиска, удаляя устаревшие записи и ограничивая размер кэша.
+
+        Записи хранятся в порядке добавления, поэтому первыми в кэше всегда лежат самые старые: устаревшие записи и
+        записи сверх cache_size удаляются с начала за амортизированное O(1).
+
+        :param text: Текст поискового запроса.
+        :param result: Результат поиска.
+        """
+
+        now = time.monotonic()
+        self._cache.pop(text, None)
+        self._cache[text] = (now, result)
+
+        while self._cache:
+            stored_at, _ = next(iter(self._cache.values()))
+
+            if len(self._cache) <= self.cache_size and now - stored_at < self.cache_ttl:
+                break
+
+            self._cache.popitem(last=False)
+
+    def _fetch(self, text: str) -> tuple:
+        """
+        Выполняет запрос к API, инициализирует объекты вакансий и оставляет по одной из почти одинаковых вакансий.
+
+        :param text: Текст поискового запроса.
+        :return: Кортеж (список словарей вакансий, список объектов JobVacancy).
+        """
+
+        vacancies = self.service.fetch_vacancies(text)
+        vacancies_obj_list = initialize_job_vacancy(vacancies)
+        representatives = representative_indices(vacancies_obj_list)
+
+        return [vacancies[index] for index in representatives], [vacancies_obj_list[index] for index in representatives]
+
+    async def filter(self, params: dict) -> list:
+        """
+        Возвращает вакансии, отфильтрованные по ключевым словам и диапазону зарплат.
+
+        :param params: Параметры запроса (text, keywords, salary).
+        :return: Список объектов JobVacancy.
+        """
+
+        _, vacancies = await self.search(self._require(params, 'text'))
+        keywords = params.get('keywords', '').replace(',', ' ').split()
+        salary_range = params.get('salary', '')
+
+        try:
+            return filter_vacancies(vacancies, keywords, salary_range)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Диапазон зарплат задаётся в формате '100000 - 150000'")
+
+    async def handle(self, method: str, target: str, body: bytes) -> tuple:
+        """
+        Обрабатывает один HTTP-запрос.
+
+        :param method: HTTP-метод.
+        :param target: Путь запроса вместе со строкой параметров.
+        :param body: Тело запроса.
+        :return: Кортеж (HTTP-статус, объект для сериализации в JSON).
+        """
+
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        match method, url.path:
+            case 'GET', '/search':
+                vacancies, _ = await self.search(self._require(params, 'text'))
+                return HTTPStatus.OK, vacancies
+            case 'GET', '/filter':
+                return HTTPStatus.OK, [self._to_dict(vacancy) for vacancy in await self.filter(params)]
+            case 'GET', '/top':
+                top_count = int(params.get('n', 10))
+                vacancies = sorted(await self.filter(params), key=attrgetter('sort_key'), reverse=True)[:top_count]
+                return HTTPStatus.OK, [self._to_dict(vacancy) for vacancy in vacancies]
+            case 'POST', '/export':
+                return HTTPStatus.OK, await self.export(json.loads(body or b'{}'))
+            case 'GET' | 'POST', _:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"Неизвестный путь: {url.path}")
+            case _:
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"Метод {method} не поддерживается")
+
+    async def export(self, payload: dict) -> dict:
+        """
+        Сохраняет вакансии по поисковому запросу в файлы выбранных форматов.
+
+        :param payload: Словарь с ключами text, formats (список из json, jsonl, csv, txt, xlsx; вместо него допускается
+                        format с одним форматом) и filename.
+        :return: Словарь с путями к файлам по форматам и количеством сохранённых вакансий.
+        """
+
+        formats = payload.get('formats') or [payload.get('format', 'json')]
+        unknown = [file_format for file_format in formats if file_format not in STORAGE_FORMATS]
+
+        if unknown:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Допустимые форматы: {', '.join(STORAGE_FORMATS)}")
+
+        vacancies, _ = await self.search(self._require(payload, 'text'))
+        name = os.path.basename(self._require(payload, 'filename'))
+        filenames = await asyncio.to_thread(export_vacancies, vacancies, name, formats, self.export_dir)
+
+        return {'filenames': filenames, 'count': len(vacancies)}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обслуживает TCP-соединение: читает HTTP/1.1 запросы, пока клиент держит соединение открытым.
+
+        :param reader: Поток чтения соединения.
+        :param writer: Поток записи соединения.
+        """
+
+        try:
+            while True:
+                request_line = await reader.readline()
+
+                if not request_line.strip():
+                    break
+
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                try:
+                    status, result = await self.handle(method, target, body)
+                except HTTPError as error:
+                    status, result = error.status, {'error': str(error)}
+                except (KeyError, ValueError) as error:
+                    status, result = HTTPStatus.BAD_REQUEST, {'error': str(error)}
+                except requests.RequestException as error:
+                    status, result = HTTPStatus.BAD_GATEWAY, {'error': str(error)}
+                except Exception as error:
+                    status, result = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(error)}
+
+                keep_alive = (headers.get('connection', '').lower() != 'close') and version == 'HTTP/1.1'
+                payload = json.dumps(result, ensure_ascii=False).encode('utf-8')
+                writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                             f"Content-Type: application/json; charset=utf-8\r\n"
+                             f"Content-Length: {len(payload)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1'))
+                writer.write(payload)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8080) -> None:
+        """
+        Запускает сервер и обслуживает запросы до остановки процесса.
+
+        :param host: Адрес для прослушивания.
+        :param port: Порт для прослушивания.
+        """
+
+        server = await asyncio.start_server(self.handle_connection, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+    @staticmethod
+    def _require(params: dict, name: str) -> str:
+        """
+        Возвращает обязательный параметр запроса.
+
+        :param params: Параметры запроса.
+        :param name: Имя параметра.
+        :return: Значение параметра.
+        """
+
+        if not params.get(name):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Не указан параметр {name}")
+
+        return params[name]
+
+    @staticmethod
+    def _to_dict(vacancy: JobVacancy) -> dict:
+        """
+        Преобразует объект вакансии в словарь для ответа.
+
+        :param vacancy: Объект вакансии.
+        :return: Словарь с полями вакансии.
+        """
+
+        return {"title": vacancy.title, "url": vacancy.url, "salary_min": vacancy.salary_min,
+                "salary_max": vacancy.salary_max, "description": vacancy.description}
+
+
+def main() -> None:
+    """
+    Точка входа сервиса: python -m src.server --host 127.0.0.1 --port 8080
+    """
+
+    parser = argparse.ArgumentParser(description="HTTP сервис поиска вакансий hh.ru")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--cache-ttl', type=float, default=300, help="Время жизни кэша поиска в секундах")
+    parser.add_argument('--cache-size', type=int, default=1024, help="Максимальное количество запросов в кэше")
+    parser.add_argument('--export-dir', default='data', help="Директория для файлов /export")
+    parser.add_argument('--rate-limit-state', metavar='FILE',
+                        help="Файл общего состояния ограничителя частоты запросов для нескольких процессов сервиса")
+    args = parser.parse_args()
+
+    server = VacancyServer(cache_ttl=args.cache_ttl, export_dir=args.export_dir, cache_size=args.cache_size,
+                           rate_limit_state=args.rate_limit_state)
+    asyncio.run(server.serve(args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
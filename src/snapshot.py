@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+from typing import Iterable, Iterator, NamedTuple, Union
+
+import numpy as np
+
+from src.abstract_classes import VacancyStorage
+from src.file_io import atomic_open
+from src.mmap_index import HEADER_DTYPE
+
+
+FINGERPRINT_DTYPE = np.dtype([('url', '<u8'), ('content', '<u8')])
+
+
+def _hash64(data: str) -> int:
+    """
+    Вычисляет 64-битный хеш строки (BLAKE2b).
+
+    :param data: Хешируемая строка.
+    :return: Беззнаковое 64-битное целое.
+    """
+
+    return int.from_bytes(hashlib.blake2b(data.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def fingerprint(vacancy: dict) -> tuple:
+    """
+    Вычисляет отпечаток вакансии: хеш URL и хеш содержимого.
+
+    Хеш URL идентифицирует вакансию между снимками, хеш содержимого позволяет обнаружить её изменение. Содержимое
+    сериализуется с сортировкой ключей, поэтому порядок полей не влияет на результат.
+
+    :param vacancy: Словарь с данными о вакансии.
+    :return: Кортеж (хеш URL, хеш содержимого).
+    """
+
+    content = json.dumps(vacancy, ensure_ascii=False, sort_keys=True, default=str)
+
+    return _hash64(str(vacancy.get('url', ''))), _hash64(content)
+
+
+class SnapshotDiff(NamedTuple):
+    """
+    Результат сравнения двух снимков. Каждое поле - отсортированный массив хешей URL.
+    """
+
+    added: np.ndarray
+    removed: np.ndarray
+    changed: np.ndarray
+
+
+class SnapshotIndex:
+    """
+    Компактный индекс снимка вакансий - отсортированный по хешу URL массив отпечатков.
+
+    Индекс хранится рядом с файлом хранилища в файле '<filename>.fp' (заголовок с размером, временем изменения в
+    наносекундах и inode файла данных, затем 16 байт на вакансию) и читается через memory-map, поэтому сравнение
+    снимков не требует загрузки самих вакансий.
+
+    Атрибуты:
+        - fingerprints (np.ndarray): Массив записей (url, content), отсортированный по url, без повторов url.
+
+    Методы:
+        - from_vacancies(vacancies): Строит индекс по списку вакансий.
+        - for_storage(storage): Возвращает индекс файлового хранилища, перестраивая его при необходимости.
+        - load(path) / save(path, stamp): Чтение и запись индекса.
+        - diff(newer): Сравнивает снимок с более новым.
+    """
+
+    version = 1
+    suffix = '.fp'
+
+    def __init__(self, fingerprints: np.ndarray) -> None:
+        """
+        Инициализирует экземпляр класса SnapshotIndex.
+
+        :param fingerprints: Отсортированный по url массив с типом FINGERPRINT_DTYPE.
+        """
+
+        self.fingerprints = fingerprints
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[dict]) -> 'SnapshotIndex':
+        """
+        Строит индекс по вакансиям. При повторении URL остаётся последняя версия вакансии.
+
+        :param vacancies: Итерируемый набор словарей вакансий.
+        :return: Экземпляр SnapshotIndex.
+        """
+
+        fingerprints = np.fromiter((fingerprint(vacancy) for vacancy in vacancies), dtype=FINGERPRINT_DTYPE)
+        fingerprints = fingerprints[::-1]
+        _, first = np.unique(fingerprints['url'], return_index=True)
+
+        return cls(fingerprints[first])
+
+    @classmethod
+    def for_storage(cls, storage: VacancyStorage) -> 'SnapshotIndex':
+        """
+        Возвращает индекс файлового хранилища.
+
+        Индекс считается актуальным, если размер, время изменения (st_mtime_ns) и inode файла данных совпадают с
+        записанными в заголовке индекса. Иначе индекс строится заново по записям, прочитанным потоково (см.
+        iter_vacancies), и сохраняется. Отметка снимается до чтения данных: если файл изменится во время построения,
+        индекс будет перестроен при следующем обращении.
+
+        :param storage: Хранилище с атрибутом filename.
+        :return: Экземпляр SnapshotIndex.
+        """
+
+        path = storage.filename + cls.suffix
+        stat = os.stat(storage.filename)
+        stamp = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        header = cls._load_header(path)
+
+        if header is not None and (header['size'], header['mtime_ns'], header['inode']) == stamp:
+            return cls.load(path)
+
+        index = cls.from_vacancies(iter_vacancies(storage))
+        index.save(path, stamp)
+
+        return index
+
+    @classmethod
+    def _load_header(cls, path: str) -> Union[np.void, None]:
+        """
+        Читает заголовок файла индекса.
+
+        :param path: Путь к файлу индекса.
+        :return: Заголовок с типом HEADER_DTYPE или None, если файла нет или он другой версии.
+        """
+
+        try:
+            header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        except FileNotFoundError:
+            return None
+
+        if not len(header) or header[0]['version'] != cls.version:
+            return None
+
+        return header[0]
+
+    @classmethod
+    def load(cls, path: str) -> 'SnapshotIndex':
+        """
+        Открывает файл индекса через memory-map.
+
+        :param path: Путь к файлу индекса.
+        :return: Экземпляр SnapshotIndex.
+        """
+
+        if os.path.getsize(path) <= HEADER_DTYPE.itemsize:
+            return cls(np.empty(0, dtype=FINGERPRINT_DTYPE))
+
+        return cls(np.memmap(path, dtype=FINGERPRINT_DTYPE, mode='r', offset=HEADER_DTYPE.itemsize))
+
+    def save(self, path: str, stamp: tuple = (0, 0, 0)) -> None:
+        """
+        Атомарно сохраняет индекс в файл.
+
+        :param path: Путь к файлу индекса.
+        :param stamp: Размер, время изменения и inode файла данных, по которому построен индекс.
+        """
+
+        header = np.array([(self.version, *stamp)], dtype=HEADER_DTYPE)
+
+        with atomic_open(path, 'wb') as file:
+            file.write(header.tobytes())
+            file.write(np.ascontiguousarray(self.fingerprints).tobytes())
+
+    def diff(self, newer: 'SnapshotIndex') -> SnapshotDiff:
+        """
+        Сравнивает снимок с более новым линейным слиянием двух отсортированных массивов.
+
+        Массивы объединяются и упорядочиваются устойчивой сортировкой. Для двух уже отсортированных частей она
+        сводится к одному проходу слияния (timsort находит обе серии и сливает их за линейное время). Так как url в
+        каждом снимке уникальны, одинаковые соседние url образуют пару «старая запись, новая запись».
+
+        :param newer: Индекс более нового снимка.
+        :return: SnapshotDiff с хешами URL добавленных, удалённых и изменённых вакансий.
+        """
+
+        old, new = self.fingerprints, newer.fingerprints
+        merged = np.concatenate([old, new])
+        order = np.argsort(merged['url'], kind='stable')
+        urls, contents, from_new = merged['url'][order], merged['content'][order], order >= len(old)
+
+        pairs = urls[1:] == urls[:-1]
+        paired = np.zeros(len(urls), dtype=bool)
+        paired[:-1] |= pairs
+        paired[1:] |= pairs
+
+        return SnapshotDiff(added=urls[from_new & ~paired], removed=urls[~from_new & ~paired],
+                            changed=urls[1:][pairs & (contents[1:] != contents[:-1])])
+
+
+def iter_vacancies(storage: VacancyStorage) -> Iterator[dict]:
+    """
+    Последовательно перебирает вакансии хранилища.
+
+    Хранилища, умеющие читать записи по одной (_iter_data), не загружают файл в память целиком; для остальных
+    (например, XLSXVacancyStorage) данные загружаются полностью.
+
+    :param storage: Файловое хранилище вакансий.
+    :return: Итератор словарей вакансий.
+    """
+
+    if hasattr(storage, '_iter_data'):
+        return storage._iter_data()
+
+    return iter(storage._load_data())
+
+
+def diff_storages(old_storage: VacancyStorage, new_storage: VacancyStorage) -> SnapshotDiff:
+    """
+    Сравнивает два сохранённых снимка вакансий по их индексам отпечатков.
+
+    :param old_storage: Хранилище с предыдущим снимком.
+    :param new_storage: Хранилище с новым снимком.
+    :return: SnapshotDiff с хешами URL добавленных, удалённых и изменённых вакансий.
+    """
+
+    return SnapshotIndex.for_storage(old_storage).diff(SnapshotIndex.for_storage(new_storage))
+
+
+def select_by_url_hash(vacancies: Iterable[dict], url_hashes: np.ndarray) -> list:
+    """
+    Отбирает вакансии, хеши URL которых входят в заданный набор (например, в одно из полей SnapshotDiff).
+
+    :param vacancies: Итерируемый набор словарей вакансий.
+    :param url_hashes: Массив хешей URL.
+    :return: Список подходящих вакансий.
+    """
+
+    wanted = set(url_hashes.tolist())
+
+    return [vacancy for vacancy in vacancies if _hash64(str(vacancy.get('url', ''))) in wanted]
@@ -1,9 +1,21 @@
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, Union
 
 
-from src.classes import (JobVacancy, HHVacancyService, JSONVacancyStorage, CSVVacancyStorage, TXTVacancyStorage,
-                         XLSXVacancyStorage)
+from src.classes import (JobVacancy, HHVacancyService, JSONVacancyStorage, JSONLVacancyStorage, CSVVacancyStorage,
+                         TXTVacancyStorage, XLSXVacancyStorage, SalaryRange)
+from src import profiling
+from src.dedup import representative_indices
+from src.file_io import writer_lock
+from src.rate_limit import AdaptiveRateLimiter
+
+
+STORAGE_FORMATS = {'json': JSONVacancyStorage, 'jsonl': JSONLVacancyStorage, 'csv': CSVVacancyStorage,
+                   'txt': TXTVacancyStorage, 'xlsx': XLSXVacancyStorage}
 
 
 def save_vacancies(vacancies: list, mode: str) -> None:
@@ -21,7 +33,9 @@ def save_vacancies(vacancies: list, mode: str) -> None:
                  '1' - для сохранения в JSON,
                  '2' - для сохранения в CSV,
                  '3' - для сохранения в TXT,
-                 '4' - для сохранения в XLSX.
+                 '4' - для сохранения в XLSX,
+                 '5' - для сохранения во все четыре формата сразу.
+                 Во всех режимах вакансии дописываются к уже существующему файлу с тем же именем.
     """
 
     user_answer = input("Введите имя файла: ")
@@ -42,13 +56,98 @@ def save_vacancies(vacancies: list, mode: str) -> None:
         case 3:
             filename = os.path.join("data", user_answer + ".txt")
             txt_storage = TXTVacancyStorage(filename)
-            txt_storage.add_vacancy(vacancies)
+            txt_storage.add_vacancies(vacancies)
         case 4:
             filename = os.path.join("data", user_answer + ".xlsx")
             xlsx_storage = XLSXVacancyStorage(filename)
 
             for item in vacancies:
                 xlsx_storage.add_vacancy(item)
+        case 5:
+            export_vacancies(vacancies, user_answer, ('json', 'csv', 'txt', 'xlsx'), append=True)
+
+
+def export_vacancies(vacancies: Iterable[dict], name: str, formats: Iterable[str], directory: str = "data",
+                     use_processes: bool = False, append: bool = False) -> dict:
+    """
+    Сохраняет один и тот же набор вакансий сразу в несколько форматов.
+
+    Вакансии один раз приводятся к общему представлению - списку словарей с одинаковым набором ключей, - после чего
+    файлы всех форматов записываются параллельно. Общее время записи определяется самым медленным форматом, а не суммой
+    всех. По умолчанию используются потоки; при use_processes=True каждый формат записывается в отдельном процессе,
+    что позволяет обойти GIL ценой передачи данных между процессами. Существующие файлы перезаписываются, если не
+    указан append=True.
+
+    :param vacancies: Итерируемый набор словарей вакансий.
+    :param name: Имя файлов без расширения.
+    :param formats: Форматы для сохранения: 'json', 'jsonl', 'csv', 'txt', 'xlsx'.
+    :param directory: Директория для сохранения файлов.
+    :param use_processes: Записывать форматы в отдельных процессах вместо потоков.
+    :param append: Дописывать вакансии к существующим файлам вместо их перезаписи.
+    :return: Словарь {формат: путь к файлу}.
+    """
+
+    formats = list(dict.fromkeys(formats))
+    unknown = [file_format for file_format in formats if file_format not in STORAGE_FORMATS]
+
+    if unknown:
+        raise ValueError(f"Неизвестные форматы: {', '.join(unknown)}")
+
+    records = _prepare_records(vacancies)
+    filenames = {file_format: os.path.join(directory, name + STORAGE_FORMATS[file_format].extension)
+                 for file_format in formats}
+    os.makedirs(directory, exist_ok=True)
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+    with executor_class(max_workers=max(len(formats), 1)) as executor:
+        futures = [executor.submit(_write_format, file_format, filename, records, append)
+                   for file_format, filename in filenames.items()]
+
+        for future in futures:
+            future.result()
+
+    return filenames
+
+
+def _prepare_records(vacancies: Iterable[dict]) -> list:
+    """
+    Приводит вакансии к общему представлению для всех форматов: список словарей с одинаковым порядком ключей.
+
+    Отсутствующие у вакансии поля заполняются None, поэтому табличные форматы получают одинаковые столбцы.
+
+    :param vacancies: Итерируемый набор словарей вакансий.
+    :return: Список словарей.
+    """
+
+    vacancies = list(vacancies)
+    columns = list(dict.fromkeys(key for vacancy in vacancies for key in vacancy))
+
+    return [{column: vacancy.get(column) for column in columns} for vacancy in vacancies]
+
+
+def _write_format(file_format: str, filename: str, records: list, append: bool = False) -> None:
+    """
+    Записывает вакансии в файл одного формата через соответствующее хранилище.
+
+    :param file_format: Формат файла (ключ STORAGE_FORMATS).
+    :param filename: Путь к файлу.
+    :param records: Список словарей вакансий.
+    :param append: Дописать вакансии к существующему файлу, если он есть. Хранилища с add_vacancies (JSONL, TXT)
+                   дописывают строки в конец файла без его чтения под собственной блокировкой; остальные форматы
+                   перезаписываются целиком вместе с существующими вакансиями, чтобы столбцы CSV и XLSX совпадали.
+    """
+
+    storage = STORAGE_FORMATS[file_format](filename)
+
+    if append and hasattr(storage, 'add_vacancies'):
+        storage.add_vacancies(records)
+        return
+
+    with writer_lock(filename):
+        if append and os.path.exists(filename):
+            records = _prepare_records(storage._load_data() + records)
+
+        storage._save_data(records)
 
 
 def get_vacancies() -> list:
@@ -57,10 +156,11 @@ def get_vacancies() -> list:
 
     Функция запрашивает у пользователя поисковой запрос, количество вакансий для отображения в топе, ключевые слова
     для фильтрации вакансий и диапазон зарплаты. Далее осуществляется поиск вакансий по заданным параметрам через API
-    HeadHunter (HH), производится их фильтрация и сортировка. В конечном итоге на экран выводится заданное количество
+    HeadHunter (HH), из почти одинаковых вакансий (перепубликации, копии в разных регионах) остаётся по одной, после
+    чего производится их фильтрация и сортировка. В конечном итоге на экран выводится заданное количество
     топовых вакансий, удовлетворяющих всем заданным критериям.
 
-    :return: Полный список вакансий по критериям.
+    :return: Полный список вакансий по критериям без почти одинаковых вакансий.
     """
 
     search_query = input("Введите поисковый запрос: ")
@@ -68,11 +168,23 @@ def get_vacancies() -> list:
     filter_words = input("Введите ключевые слова для фильтрации вакансий (через пробел): ").split()
     salary_range = input("Введите диапазон зарплат (например: 100000 - 150000): ")
 
-    hh_api = HHVacancyService()
-    vacancies = hh_api.fetch_vacancies(search_query)
-    vacancies_obj_list = initialize_job_vacancy(vacancies)
-    filtered_vacancies = filter_vacancies(vacancies_obj_list, filter_words, salary_range)
-    sorted_vacancies = sorted(filtered_vacancies, reverse=True)
+    hh_api = HHVacancyService(rate_limiter=AdaptiveRateLimiter())
+
+    with profiling.stage('fetch_vacancies'):
+        vacancies = hh_api.fetch_vacancies(search_query)
+
+    with profiling.stage('initialize_job_vacancy'):
+        vacancies_obj_list = initialize_job_vacancy(vacancies)
+
+    with profiling.stage('deduplicate'):
+        representatives = representative_indices(vacancies_obj_list)
+        vacancies = [vacancies[index] for index in representatives]
+        vacancies_obj_list = [vacancies_obj_list[index] for index in representatives]
+
+    with profiling.stage('filter_vacancies'):
+        filtered_vacancies = filter_vacancies(vacancies_obj_list, filter_words, salary_range)
+        sorted_vacancies = sorted(filtered_vacancies, key=attrgetter('sort_key'), reverse=True)
+
     print_vacancies(sorted_vacancies[:top_count])
 
     return vacancies
@@ -111,7 +223,7 @@ def initialize_job_vacancy(vacancies_list: list) -> list:
     return vacancies_obj_list
 
 
-def filter_vacancies(vacancies_list: list, filter_words: list, salary_range: str) -> list:
+def filter_vacancies(vacancies_list: list, filter_words: list, salary_range: Union[str, SalaryRange]) -> list:
     """
     Фильтрует список вакансий по ключевым словам и диапазону заработной платы.
 
@@ -122,19 +234,44 @@ def filter_vacancies(vacancies_list: list, filter_words: list, salary_range: str
     :param filter_words: Список ключевых слов для фильтрации вакансий. Вакансия должна соответствовать хотя бы одному
                          слову из этого списка.
     :param salary_range: Диапазон заработной платы в форме строки из двух элементов - минимальной и максимальной
-                         заработной платы. Вакансия должна предлагать заработную плату в этом диапазоне.
+                         заработной платы (или SalaryRange). Вакансия должна предлагать заработную плату в этом
+                         диапазоне; не указанные у вакансии значения зарплаты диапазон не ограничивают.
     :return: Список объектов вакансий, соответствующих указанным критериям фильтрации.
     """
 
     filtered_obj_list = []
+    matcher = keyword_matcher(tuple(filter_words))
+
+    if isinstance(salary_range, str):
+        salary_range = SalaryRange.parse(salary_range)
 
     for vacancy in vacancies_list:
-        if filter_words == vacancy and vacancy.comparison_salary(salary_range):
+        if matcher(vacancy.description) and salary_range.contains(vacancy.salary):
             filtered_obj_list.append(vacancy)
 
     return filtered_obj_list
 
 
+@lru_cache(maxsize=256)
+def keyword_matcher(filter_words: tuple) -> Callable[[str], bool]:
+    """
+    Возвращает функцию, проверяющую вхождение хотя бы одного из ключевых слов в текст.
+
+    Все слова объединяются в одно регулярное выражение, поэтому текст просматривается один раз. Скомпилированные
+    выражения кэшируются, и повторные запросы с тем же набором слов не компилируют их заново.
+
+    :param filter_words: Кортеж ключевых слов.
+    :return: Функция от строки, возвращающая True, если строка содержит хотя бы одно ключевое слово.
+    """
+
+    if not filter_words:
+        return lambda text: False
+
+    pattern = re.compile('|'.join(re.escape(word) for word in sorted(set(filter_words), key=len, reverse=True)))
+
+    return lambda text: pattern.search(text) is not None
+
+
 def get_top_vacancies(vacancies_list: list, top_count: int) -> list:
     """
     Возвращает первые N вакансий из списка вакансий.
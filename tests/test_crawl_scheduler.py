@@ -0,0 +1,134 @@
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+
+from src.classes import JSONLVacancyStorage
+from src.crawler import CrawlScheduler, DATE_FORMAT
+
+
+START = datetime(2024, 1, 1)
+
+
+class FakeService:
+    """
+    Имитация API: 60 вакансий, опубликованных раз в час, с двумя регионами и постраничной выдачей.
+    """
+
+    def __init__(self, fail_area=None):
+        self.fail_area = fail_area
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.items = [{"id": str(index), "name": f"Vacancy {index}", "alternate_url": f"https://hh.ru/vacancy/{index}",
+                       "area": str(index % 2), "published_at": (START + timedelta(hours=index)).strftime(DATE_FORMAT)}
+                      for index in range(60)]
+
+    def fetch_page(self, params):
+        with self.lock:
+            self.calls += 1
+
+        if params['area'] == self.fail_area:
+            raise ConnectionError("Сервис недоступен")
+
+        found = [item for item in self.items if item['area'] == params['area']
+                 and params['date_from'] <= item['published_at'] <= params['date_to']]
+        start = params['page'] * params['per_page']
+
+        return {"found": len(found), "pages": -(-len(found) // params['per_page']),
+                "items": found[start:start + params['per_page']]}
+
+
+def make_scheduler(tmp_path, service):
+    scheduler = CrawlScheduler("python", str(tmp_path / 'crawl.jsonl'), areas=("0", "1"), date_from=START,
+                               date_to=START + timedelta(hours=60), service=service)
+    scheduler.max_depth = 8
+    scheduler.per_page = 3
+
+    return scheduler
+
+
+def test_crawl_splits_and_dedupes(tmp_path):
+    """
+    Проверяет, что крупные подзапросы разбиваются по времени, а все вакансии сохраняются ровно один раз.
+    """
+
+    scheduler = make_scheduler(tmp_path, FakeService())
+
+    assert scheduler.run() == 60
+
+    ids = [vacancy['id'] for vacancy in JSONLVacancyStorage(str(tmp_path / 'crawl.jsonl')).get_vacancies({})]
+
+    assert sorted(ids, key=int) == [str(index) for index in range(60)]
+    assert not scheduler.truncated
+    assert not os.path.exists(str(tmp_path / 'crawl.jsonl.state'))
+
+
+def test_crawl_resumes_after_failure(tmp_path):
+    """
+    Проверяет, что незавершённые подзапросы остаются в файле состояния и выполняются при повторном запуске.
+    """
+
+    scheduler = make_scheduler(tmp_path, FakeService(fail_area="1"))
+    scheduler.max_attempts = 1
+
+    assert scheduler.run() == 30
+    assert len(scheduler.failed) == 1
+    assert os.path.exists(str(tmp_path / 'crawl.jsonl.state'))
+
+    service = FakeService()
+    resumed = make_scheduler(tmp_path, service)
+
+    assert resumed.run() == 30
+    assert len(JSONLVacancyStorage(str(tmp_path / 'crawl.jsonl')).get_vacancies({})) == 60
+    assert not os.path.exists(str(tmp_path / 'crawl.jsonl.state'))
+
+
+def test_crawl_retries_failed_write(tmp_path):
+    """
+    Проверяет, что вакансии из неудачной записи сохраняются при повторной попытке подзапроса.
+    """
+
+    scheduler = make_scheduler(tmp_path, FakeService())
+    add_vacancies = scheduler.output.add_vacancies
+    failures = [OSError("Нет места на диске")]
+
+    def flaky_add_vacancies(vacancies):
+        if failures:
+            raise failures.pop()
+
+        add_vacancies(vacancies)
+
+    scheduler.output.add_vacancies = flaky_add_vacancies
+
+    assert scheduler.run() == 60
+    assert not scheduler.failed
+    assert len(JSONLVacancyStorage(str(tmp_path / 'crawl.jsonl')).get_vacancies({})) == 60
+
+
+def test_resume_rejects_different_crawl(tmp_path):
+    """
+    Проверяет, что файл состояния другого обхода (другой запрос, регионы или окно) не продолжается молча.
+    """
+
+    scheduler = make_scheduler(tmp_path, FakeService(fail_area="1"))
+    scheduler.max_attempts = 1
+    scheduler.run()
+
+    other_query = CrawlScheduler("java", str(tmp_path / 'crawl.jsonl'), areas=("0", "1"), date_from=START,
+                                 date_to=START + timedelta(hours=60), service=FakeService())
+    other_areas = CrawlScheduler("python", str(tmp_path / 'crawl.jsonl'), areas=("1",), date_from=START,
+                                 date_to=START + timedelta(hours=60), service=FakeService())
+    other_window = CrawlScheduler("python", str(tmp_path / 'crawl.jsonl'), areas=("0", "1"), date_from=START,
+                                  date_to=START + timedelta(hours=30), service=FakeService())
+
+    for other in (other_query, other_areas, other_window):
+        with pytest.raises(ValueError):
+            other.run()
+
+    default_window = CrawlScheduler("python", str(tmp_path / 'crawl.jsonl'), areas=("0", "1"), service=FakeService())
+    default_window.max_depth = 8
+    default_window.per_page = 3
+
+    assert default_window.run() == 30
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+
+from src.classes import JobVacancy
+from src.dedup import MinHashLSH, deduplicate_vacancies, representative_indices, shingles
+
+
+def _vacancy(title, description, url="u"):
+    return JobVacancy(title, url, 100000, 150000, description)
+
+
+def test_shingles_normalize_text():
+    """
+    Проверяет, что регистр и знаки препинания не влияют на шинглы, а короткий текст становится одним шинглом.
+    """
+
+    assert set(shingles("Python-разработчик")) == set(shingles("python  разработчик"))
+    assert len(shingles("SQL")) == 1
+    assert len(shingles("  ,. ")) == 0
+
+
+def test_signature_similarity_estimates_jaccard():
+    """
+    Проверяет, что сходство сигнатур одинаковых текстов равно 1, а разных - близко к 0.
+    """
+
+    lsh = MinHashLSH()
+    signatures = lsh.signatures(["Python разработчик Django", "Python разработчик Django",
+                                 "Водитель погрузчика, ночные смены"])
+
+    assert signatures.shape == (3, lsh.num_perm)
+    assert lsh.similarity(signatures[0], signatures[1]) == 1
+    assert lsh.similarity(signatures[0], signatures[2]) < 0.2
+
+
+def test_num_perm_must_divide_into_bands():
+    """
+    Проверяет ошибку при длине сигнатуры, не делящейся на количество полос.
+    """
+
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=100, bands=32)
+
+
+def test_deduplicate_keeps_first_of_each_cluster():
+    """
+    Проверяет, что из почти одинаковых вакансий остаётся первая, а непохожие вакансии сохраняются в исходном порядке.
+    """
+
+    vacancies = [_vacancy("Python-разработчик (Middle)", "Опыт работы с Python от 3 лет, Django, PostgreSQL", "u1"),
+                 _vacancy("Java developer", "Опыт Spring Boot, Kafka, микросервисы", "u2"),
+                 _vacancy("Python разработчик Middle", "Опыт работы с Python от 3 лет, Django, PostgreSQL.", "u3"),
+                 _vacancy("Python разработчик Senior", "Python от 5 лет, Kubernetes, лидерство команды", "u4")]
+
+    assert [vacancy.url for vacancy in deduplicate_vacancies(vacancies)] == ["u1", "u2", "u4"]
+
+
+def test_empty_texts_are_not_merged():
+    """
+    Проверяет, что вакансии без текста не считаются дубликатами друг друга.
+    """
+
+    assert representative_indices([_vacancy("", ""), _vacancy("", "")]) == [0, 1]
+    assert representative_indices([]) == []
+
+
+def test_clusters_scale_to_many_vacancies():
+    """
+    Проверяет кластеризацию большого набора: каждая копия объединяется со своим оригиналом.
+    """
+
+    generator = np.random.default_rng(0)
+    texts = [" ".join(f"w{word}" for word in generator.integers(0, 5000, size=30)) for _ in range(2000)]
+    clusters = MinHashLSH().clusters(texts + texts[:50])
+
+    assert len(clusters) == 2000
+    assert clusters[:50] == [[index, 2000 + index] for index in range(50)]
@@ -0,0 +1,95 @@
+import csv
+import json
+
+import pandas as pd
+import pytest
+
+
+from src.classes import JSONVacancyStorage, JSONLVacancyStorage, TXTVacancyStorage
+from src.utils import export_vacancies, save_vacancies
+
+
+VACANCIES = [{"title": "Python Developer", "url": "u1", "salary_min": 100000},
+             {"title": "Java Developer", "url": "u2", "salary_max": 200000}]
+
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_export_all_formats(tmp_path, use_processes):
+    """
+    Проверяет запись одного набора вакансий сразу в несколько форматов с одинаковым набором полей.
+    """
+
+    filenames = export_vacancies(VACANCIES, 'report', ['json', 'csv', 'xlsx'], str(tmp_path), use_processes)
+
+    with open(filenames['json'], encoding='utf-8') as f:
+        assert json.load(f)[1] == {"title": "Java Developer", "url": "u2", "salary_min": None, "salary_max": 200000}
+
+    with open(filenames['csv'], newline='', encoding='utf-8') as f:
+        assert csv.DictReader(f).fieldnames == ['title', 'url', 'salary_min', 'salary_max']
+
+    assert len(pd.read_excel(filenames['xlsx'])) == 2
+
+
+def test_export_unknown_format(tmp_path):
+    """
+    Проверяет, что неизвестный формат отклоняется до записи файлов.
+    """
+
+    with pytest.raises(ValueError):
+        export_vacancies(VACANCIES, 'report', ['json', 'pdf'], str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_append(tmp_path):
+    """
+    Проверяет, что при append=True вакансии дописываются к существующим файлам всех форматов.
+    """
+
+    formats = ['json', 'jsonl', 'csv', 'txt', 'xlsx']
+    export_vacancies(VACANCIES, 'report', formats, str(tmp_path))
+    filenames = export_vacancies(VACANCIES[:1], 'report', formats, str(tmp_path), append=True)
+
+    with open(filenames['json'], encoding='utf-8') as f:
+        assert [vacancy['url'] for vacancy in json.load(f)] == ['u1', 'u2', 'u1']
+
+    with open(filenames['csv'], newline='', encoding='utf-8') as f:
+        assert len(list(csv.DictReader(f))) == 3
+
+    assert len(TXTVacancyStorage(filenames['txt']).get_vacancies({})) == 3
+    assert len(pd.read_excel(filenames['xlsx'])) == 3
+
+
+@pytest.mark.parametrize('mode', ['1', '5'])
+def test_save_vacancies_appends_in_every_mode(tmp_path, monkeypatch, mode):
+    """
+    Проверяет, что сохранение во все форматы, как и в один формат, дописывает вакансии к существующему файлу.
+    """
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    monkeypatch.setattr('builtins.input', lambda prompt='': 'report')
+
+    save_vacancies(VACANCIES, mode)
+    save_vacancies(VACANCIES, mode)
+
+    assert len(JSONVacancyStorage(str(tmp_path / 'data' / 'report.json')).get_vacancies({})) == 4
+
+
+def test_export_append_does_not_read_line_formats(tmp_path, monkeypatch):
+    """
+    Проверяет, что при append=True форматы JSONL и TXT дописываются без чтения существующего файла.
+    """
+
+    export_vacancies(VACANCIES, 'report', ['jsonl', 'txt'], str(tmp_path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("файл прочитан при дописывании")
+
+    monkeypatch.setattr(JSONLVacancyStorage, '_load_data', fail)
+    monkeypatch.setattr(TXTVacancyStorage, '_load_data', fail)
+    filenames = export_vacancies(VACANCIES[:1], 'report', ['jsonl', 'txt'], str(tmp_path), append=True)
+    monkeypatch.undo()
+
+    assert len(JSONLVacancyStorage(filenames['jsonl']).get_vacancies({})) == 3
+    assert len(TXTVacancyStorage(filenames['txt']).get_vacancies({})) == 3
@@ -0,0 +1,63 @@
+import os
+import stat
+
+
+from src.classes import XLSXVacancyStorage
+from src.file_io import atomic_open, atomic_path
+
+
+def _record_fsyncs(monkeypatch):
+    synced = []
+    original_fsync = os.fsync
+
+    def fsync(fd):
+        synced.append('dir' if stat.S_ISDIR(os.fstat(fd).st_mode) else 'file')
+        original_fsync(fd)
+
+    monkeypatch.setattr(os, 'fsync', fsync)
+
+    return synced
+
+
+def test_atomic_path_syncs_file_and_directory(tmp_path, monkeypatch):
+    """
+    Проверяет, что atomic_path сбрасывает на диск временный файл перед подменой и директорию после неё.
+    """
+
+    synced = _record_fsyncs(monkeypatch)
+    filename = str(tmp_path / "data.bin")
+
+    with atomic_path(filename) as tmp_file:
+        with open(tmp_file, 'wb') as file:
+            file.write(b'data')
+
+    with open(filename, 'rb') as file:
+        assert file.read() == b'data'
+
+    assert synced == ['file', 'dir']
+
+
+def test_atomic_open_syncs_once_per_write(tmp_path, monkeypatch):
+    """
+    Проверяет, что atomic_open использует сброс на диск из atomic_path без повторного fsync.
+    """
+
+    synced = _record_fsyncs(monkeypatch)
+
+    with atomic_open(str(tmp_path / "data.txt"), 'w', encoding='utf-8') as file:
+        file.write('data')
+
+    assert synced == ['file', 'dir']
+
+
+def test_xlsx_save_is_synced(tmp_path, monkeypatch):
+    """
+    Проверяет, что XLSX хранилище, записывающее через atomic_path, тоже сбрасывает данные на диск.
+    """
+
+    synced = _record_fsyncs(monkeypatch)
+    storage = XLSXVacancyStorage(str(tmp_path / "vacancies.xlsx"))
+    storage._save_data([{"title": "Python", "url": "u1"}])
+
+    assert synced == ['file', 'dir']
+    assert storage.get_vacancies({"url": "u1"})[0]["title"] == "Python"
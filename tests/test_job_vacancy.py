@@ -1,6 +1,6 @@
 import pytest
 
-from src.classes import JobVacancy
+from src.classes import JobVacancy, SalaryRange
 
 
 def test_job_vacancy_init():
@@ -76,3 +76,40 @@ def test_vacancies_repr():
                      "для разработки.")
 
     assert repr(vacancy) == expected_repr
+
+
+def test_salary_normalization():
+    """
+    Тест проверяет, что зарплата нормализуется при создании объекта: 'Не указано' и None становятся None, а ключ
+    сортировки - целым числом.
+    """
+
+    vacancy = JobVacancy("Python Developer", "http://example.com", "Не указано", "150000")
+
+    assert vacancy.salary == SalaryRange(None, 150000)
+    assert vacancy.sort_key == 0
+    assert JobVacancy("Python Developer", "http://example.com", 90000).sort_key == 90000
+
+
+def test_comparison_salary():
+    """
+    Тест проверяет попадание зарплаты в диапазон. Не указанные границы зарплаты вакансии диапазон не ограничивают.
+    """
+
+    vacancy = JobVacancy("Python Developer", "http://example.com", 100000, 150000)
+    open_vacancy = JobVacancy("Python Developer", "http://example.com", 120000, "Не указано")
+
+    assert vacancy.comparison_salary("90000 - 160000")
+    assert not vacancy.comparison_salary("110000 - 160000")
+    assert not vacancy.comparison_salary("90000 - 140000")
+    assert open_vacancy.comparison_salary("100000 - 130000")
+    assert vacancy.comparison_salary("")
+
+
+def test_salary_range_parse_is_cached():
+    """
+    Тест проверяет, что одинаковые строки диапазона разбираются один раз.
+    """
+
+    assert SalaryRange.parse("100000 - 150000") is SalaryRange.parse("100000 - 150000")
+    assert SalaryRange.parse("- 150000") == SalaryRange(None, 150000)
@@ -1,6 +1,8 @@
+import gzip
 import json
 import pytest
 import os
+from multiprocessing import Process
 from tempfile import NamedTemporaryFile
 
 
@@ -18,6 +20,9 @@ def temp_file():
 
     os.unlink(f.name)
 
+    if os.path.exists(f.name + '.lock'):
+        os.unlink(f.name + '.lock')
+
 
 @pytest.fixture
 def storage_with_vacancy(temp_file):
@@ -71,3 +76,62 @@ def test_delete_vacancies(storage_with_vacancy, temp_file):
         data = json.load(f)
 
     assert len(data) == 0
+
+
+def _add_many(filename, worker, count):
+    storage = JSONVacancyStorage(filename=filename)
+
+    for index in range(count):
+        storage.add_vacancy({'title': f'Worker {worker} vacancy {index}'})
+
+
+def test_save_data_keeps_original_on_error(storage_with_vacancy, temp_file):
+    """
+    Проверяет, что ошибка во время записи не повреждает существующее хранилище и не оставляет временных файлов.
+    """
+
+    with pytest.raises(TypeError):
+        storage_with_vacancy.add_vacancy({'title': object()})
+
+    with open(temp_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    leftovers = [name for name in os.listdir(os.path.dirname(temp_file))
+                 if name.startswith('.' + os.path.basename(temp_file))]
+
+    assert data == [{'title': 'Developer', 'company': 'DevCompany'}]
+    assert leftovers == []
+
+
+def test_concurrent_writers(temp_file):
+    """
+    Проверяет, что параллельные процессы-писатели не теряют записи друг друга.
+    """
+
+    workers = [Process(target=_add_many, args=(temp_file, worker, 10)) for worker in range(4)]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    with open(temp_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    assert len(data) == 40
+
+
+def test_gzip_compact_storage(tmp_path):
+    """
+    Проверяет сохранение в сжатый gzip компактный JSON с выбором сжатия по расширению файла.
+    """
+
+    filename = str(tmp_path / 'vacancies.json.gz')
+    storage = JSONVacancyStorage(filename, compact=True)
+    storage.add_vacancy({'title': 'Developer', 'company': 'DevCompany'})
+
+    with gzip.open(filename, 'rt', encoding='utf-8') as f:
+        assert f.read() == '[{"title":"Developer","company":"DevCompany"}]'
+
+    assert storage.get_vacancies({'title': 'Developer'})[0]['company'] == 'DevCompany'
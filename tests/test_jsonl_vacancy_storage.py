@@ -0,0 +1,57 @@
+import pytest
+
+
+from src.classes import JSONLVacancyStorage
+from src.query import Range
+
+
+@pytest.fixture(params=['vacancies.jsonl', 'vacancies.jsonl.gz'])
+def storage(tmp_path, request):
+    """
+    Создает хранилище JSONL (без сжатия и со сжатием gzip) с тремя вакансиями.
+    """
+
+    storage = JSONLVacancyStorage(str(tmp_path / request.param))
+
+    for index in range(3):
+        storage.add_vacancy({'title': f'Developer {index}', 'salary_min': index * 100000})
+
+    return storage
+
+
+def test_add_vacancy_appends_lines(storage):
+    """
+    Проверяет, что каждая добавленная вакансия читается как отдельная запись.
+    """
+
+    assert [v['title'] for v in storage.get_vacancies({})] == ['Developer 0', 'Developer 1', 'Developer 2']
+
+
+def test_delete_vacancies(storage):
+    """
+    Проверяет удаление вакансий по условию.
+    """
+
+    storage.delete_vacancies(Range('salary_min', 100000))
+
+    assert storage.get_vacancies({}) == [{'title': 'Developer 0', 'salary_min': 0}]
+
+
+def test_zstd_appends_across_frames(tmp_path):
+    """
+    Проверяет, что вакансии из всех дописанных фреймов zstd читаются и сохраняются при удалении.
+    """
+
+    pytest.importorskip('zstandard')
+    storage = JSONLVacancyStorage(str(tmp_path / 'vacancies.jsonl.zst'))
+
+    for index in range(4):
+        storage.add_vacancies([{'title': f'Developer {index}', 'salary_min': index * 100000}])
+
+    assert [v['title'] for v in storage.get_vacancies({})] == [f'Developer {index}' for index in range(4)]
+
+    storage.delete_vacancies({'title': 'Developer 1'})
+    storage.add_vacancy({'title': 'Developer 4', 'salary_min': 400000})
+
+    assert [v['title'] for v in storage.get_vacancies(Range('salary_min', 200000))] == ['Developer 2', 'Developer 3',
+                                                                                           'Developer 4']
@@ -0,0 +1,148 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+
+from src.classes import JSONVacancyStorage, JSONLVacancyStorage, TXTVacancyStorage
+from src.mmap_index import MappedVacancyIndex
+from src.query import Eq, Range, as_query
+
+
+VACANCIES = [{"title": "Разработчик {\"Python\"}", "url": f"https://hh.ru/vacancy/{index}", "salary_min": index * 1000,
+              "tags": ["a", {"b": "]"}]} for index in range(20)]
+
+
+@pytest.fixture(params=[JSONVacancyStorage, JSONLVacancyStorage])
+def storage(tmp_path, request):
+    """
+    Создает индексируемое хранилище JSON или JSONL с 20 вакансиями.
+    """
+
+    storage_class = request.param
+    storage = storage_class(str(tmp_path / ('vacancies' + storage_class.extension)), indexed=True)
+    storage._save_data(VACANCIES)
+
+    return storage
+
+
+def test_offsets_cover_all_records(storage):
+    """
+    Проверяет, что индекс находит границы всех записей, несмотря на скобки и кавычки внутри строк.
+    """
+
+    index = MappedVacancyIndex(storage.filename)
+
+    assert len(index) == 20
+    assert index[7] == VACANCIES[7]
+    assert os.path.exists(storage.filename + MappedVacancyIndex.suffix)
+
+
+def test_point_lookup_decodes_only_candidates(storage, monkeypatch):
+    """
+    Проверяет, что поиск по URL декодирует только запись, содержащую искомое значение.
+    """
+
+    decoded = []
+    monkeypatch.setattr(storage._index, 'decoder', lambda data: decoded.append(data) or json.loads(data))
+
+    assert storage.get_vacancies({'url': 'https://hh.ru/vacancy/1'}) == [VACANCIES[1]]
+    assert len(decoded) == 1
+    assert len(storage.get_vacancies(Range('salary_min', 15000) & Eq('title', VACANCIES[0]['title']))) == 5
+
+
+def test_index_follows_file_changes(storage):
+    """
+    Проверяет, что индекс обновляется после добавления и удаления вакансий.
+    """
+
+    storage.get_vacancies({})
+    storage.add_vacancy({"title": "New", "url": "https://hh.ru/vacancy/new"})
+
+    assert storage.get_vacancies({'url': 'https://hh.ru/vacancy/new'})[0]['title'] == 'New'
+
+    storage.delete_vacancies(Range('salary_min', 1000))
+
+    assert [v['url'] for v in storage.get_vacancies({})] == ['https://hh.ru/vacancy/0', 'https://hh.ru/vacancy/new']
+
+
+MIXED = [{"title": "A", "url": "u1", "salary_min": 1, "salary_max": None, "tags": ["x", "y"], "remote": True},
+         {"title": "B", "url": "u2", "salary_min": 1.5, "tags": {"k": "v"}, "remote": False},
+         {"title": "C", "url": "u3", "salary_min": 100, "salary_max": 200, "tags": [], "remote": 1},
+         {"title": "1", "url": "u4", "salary_min": "100", "salary_max": 0}]
+
+QUERIES = [{'salary_max': None}, {'tags': ['x', 'y']}, {'tags': {'k': 'v'}}, {'salary_min': 1.0},
+           {'salary_min': 1.5}, {'salary_min': 100}, {'salary_min': '100'}, {'remote': True}, {'remote': 1},
+           {'remote': False}, {'salary_max': 0}, {'title': '1'}, {'url': 'u3', 'salary_min': 100}]
+
+
+@pytest.mark.parametrize('storage_factory', [
+    lambda path: JSONVacancyStorage(str(path / 'v.json'), indexed=True),
+    lambda path: JSONVacancyStorage(str(path / 'v.json'), compact=True, indexed=True),
+    lambda path: JSONLVacancyStorage(str(path / 'v.jsonl'), indexed=True),
+    lambda path: TXTVacancyStorage(str(path / 'v.txt')),
+], ids=['json', 'json-compact', 'jsonl', 'txt'])
+@pytest.mark.parametrize('criteria', QUERIES, ids=[str(query) for query in QUERIES])
+def test_indexed_results_match_full_scan(tmp_path, storage_factory, criteria):
+    """
+    Проверяет, что выборка через индекс совпадает с полным перебором записей для значений любых типов.
+    """
+
+    storage = storage_factory(tmp_path)
+    storage._save_data(MIXED)
+    predicate = as_query(criteria).compile()
+
+    assert storage.get_vacancies(criteria) == [vacancy for vacancy in storage._load_data() if predicate(vacancy)]
+
+
+def test_reader_is_consistent_when_file_is_replaced(storage, monkeypatch):
+    """
+    Проверяет, что атомарная подмена файла во время чтения не смешивает смещения старой версии с новым содержимым.
+    """
+
+    storage.get_vacancies({})
+    replacement = [{"title": "Заменено", "url": f"https://hh.ru/other/{index}"} for index in range(3)]
+    real_fstat = os.fstat
+
+    def fstat_then_replace(fd):
+        result = real_fstat(fd)
+        monkeypatch.setattr('src.mmap_index.os.fstat', real_fstat)
+        storage._save_data(replacement)
+
+        return result
+
+    monkeypatch.setattr('src.mmap_index.os.fstat', fstat_then_replace)
+
+    assert storage.get_vacancies({}) == VACANCIES
+    assert storage.get_vacancies({}) == replacement
+
+
+def reuse_inode(monkeypatch):
+    """
+    Подменяет fstat в модуле индекса так, чтобы любая версия файла получала один и тот же inode.
+    """
+
+    real_fstat = os.fstat
+    monkeypatch.setattr('src.mmap_index.os.fstat', lambda fd: SimpleNamespace(
+        st_size=real_fstat(fd).st_size, st_mtime_ns=real_fstat(fd).st_mtime_ns, st_ino=42))
+
+
+def test_rewrite_with_reused_inode_is_rescanned(tmp_path, monkeypatch):
+    """
+    Проверяет, что после атомарной перезаписи файла, получившего прежний inode, и дописывания индекс не применяет
+    старые смещения к новому содержимому.
+    """
+
+    reuse_inode(monkeypatch)
+    storage = JSONLVacancyStorage(str(tmp_path / 'vacancies.jsonl'), indexed=True)
+    storage.add_vacancies(VACANCIES)
+    storage.get_vacancies({})
+
+    storage.delete_vacancies(Range('salary_min', 15000))
+    storage.delete_vacancies(Eq('url', 'https://hh.ru/vacancy/0'))
+    storage.add_vacancies(VACANCIES[:10])
+    fresh = JSONLVacancyStorage(storage.filename, indexed=True)
+
+    assert fresh.get_vacancies({}) == VACANCIES[1:15] + VACANCIES[:10]
+    assert storage.get_vacancies({}) == fresh.get_vacancies({})
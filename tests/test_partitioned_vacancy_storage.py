@@ -0,0 +1,114 @@
+import os
+import threading
+import pytest
+
+
+from src.classes import PartitionedVacancyStorage, CSVVacancyStorage
+
+
+@pytest.fixture
+def vacancies():
+    return [{"title": "Junior", "url": "https://example.com/1", "salary_min": 50000, "salary_max": 70000},
+            {"title": "Middle", "url": "https://example.com/2", "salary_min": 150000, "salary_max": 200000},
+            {"title": "Senior", "url": "https://example.com/3", "salary_min": 300000, "salary_max": 400000},
+            {"title": "Intern", "url": "https://example.com/4", "salary_min": "Не указано",
+             "salary_max": "Не указано"}]
+
+
+@pytest.fixture
+def storage(tmp_path, vacancies):
+    """
+    Создает хранилище, в котором каждая вакансия лежит в отдельном шарде по дате.
+    """
+
+    storage = PartitionedVacancyStorage(str(tmp_path), partition_by='date')
+
+    for index, vacancy in enumerate(vacancies):
+        storage.add_vacancy(dict(vacancy, published_at=f"2024-01-0{index + 1}T10:00:00+0300"))
+
+    return storage
+
+
+def test_manifest_stats(storage):
+    """
+    Проверяет, что манифест содержит количество вакансий и диапазон зарплат каждого шарда.
+    """
+
+    manifest = storage.load_manifest()
+
+    assert manifest['date-2024-01-02'] == {'count': 1, 'salary_min': 150000, 'salary_max': 200000}
+    assert manifest['date-2024-01-04'] == {'count': 1, 'salary_min': None, 'salary_max': None}
+
+
+def test_salary_range_prunes_shards(storage):
+    """
+    Проверяет, что шарды с неподходящим диапазоном зарплат не выбираются для чтения.
+    """
+
+    assert storage._matching_shards({}, (100000, 250000)) == ['date-2024-01-02']
+    assert [v['title'] for v in storage.get_vacancies({}, (100000, 250000))] == ['Middle']
+
+
+def test_get_vacancies_by_partition_field(tmp_path, vacancies):
+    """
+    Проверяет, что поиск по URL при разбиении по хешу URL читает только один шард.
+    """
+
+    storage = PartitionedVacancyStorage(str(tmp_path), storage_class=CSVVacancyStorage, shards=4)
+    storage.add_vacancies(vacancies)
+
+    assert len(storage._matching_shards({'url': 'https://example.com/3'})) == 1
+    assert storage.get_vacancies({'url': 'https://example.com/3'})[0]['title'] == 'Senior'
+    assert all(name.endswith('.csv') for name in os.listdir(tmp_path) if name.startswith('url-')
+               and not name.endswith('.lock'))
+
+
+def test_delete_vacancies_updates_manifest(storage):
+    """
+    Проверяет, что удаление вакансий пересчитывает статистику шарда.
+    """
+
+    storage.delete_vacancies({'title': 'Senior'})
+
+    assert storage.load_manifest()['date-2024-01-03']['count'] == 0
+    assert storage.get_vacancies({'title': 'Senior'}) == []
+    assert len(storage.get_vacancies({})) == 3
+
+
+def test_manifest_consistent_under_concurrent_add_and_delete(tmp_path):
+    """
+    Проверяет, что при одновременных добавлениях и удалениях статистика манифеста совпадает с содержимым шарда.
+    """
+
+    storage = PartitionedVacancyStorage(str(tmp_path), shards=1)
+    storage.add_vacancy({"title": "Seed", "url": "seed", "salary_min": 1, "salary_max": 2})
+
+    def add():
+        for index in range(30):
+            storage.add_vacancy({"title": "New", "url": f"new-{index}", "salary_min": 100, "salary_max": 200})
+
+    def delete():
+        for _ in range(30):
+            storage.delete_vacancies({"title": "Missing"})
+
+    threads = [threading.Thread(target=add), threading.Thread(target=delete)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    manifest = storage.load_manifest()
+
+    assert manifest['url-0000']['count'] == 31
+    assert len(storage.get_vacancies({"title": "New"})) == 30
+
+
+def test_unknown_partition(tmp_path):
+    """
+    Проверяет ошибку при неизвестном способе разбиения.
+    """
+
+    with pytest.raises(ValueError):
+        PartitionedVacancyStorage(str(tmp_path), partition_by='query')
@@ -0,0 +1,111 @@
+import pstats
+import sys
+import threading
+
+import pytest
+
+
+import main
+from src import profiling
+from src.profiling import PipelineProfiler, StackSampler
+
+
+def _busy(iterations):
+    return sum(i * i for i in range(iterations))
+
+
+def test_pstats_profile_and_stage_summary(tmp_path):
+    """
+    Проверяет, что профиль cProfile сохраняется в формате pstats, а этапы попадают в сводку с пиком памяти.
+    """
+
+    output_file = str(tmp_path / "run.prof")
+
+    with PipelineProfiler(output_file) as profiler:
+        with profiler.stage('outer'):
+            with profiling.stage('allocate'):
+                data = [bytes(1024) for _ in range(2000)]
+            _busy(10000)
+
+    stats = pstats.Stats(output_file)
+    assert any(function == '_busy' for _, _, function in stats.stats)
+
+    assert [(stage.name, stage.depth) for stage in profiler.stages] == [('outer', 0), ('allocate', 1)]
+    outer, allocate = profiler.stages
+    assert allocate.peak_memory >= 2000 * 1024
+    assert outer.peak_memory >= allocate.peak_memory
+    assert outer.wall >= allocate.wall
+    assert len(data) == 2000
+
+    summary = profiler.summary()
+    assert 'outer' in summary and '  allocate' in summary and output_file in summary
+
+
+def test_collapsed_stacks(tmp_path):
+    """
+    Проверяет формат collapsed stacks: 'поток;модуль:функция;... количество'.
+    """
+
+    output_file = str(tmp_path / "run.folded")
+
+    with PipelineProfiler(output_file, 'collapsed', interval=0.001):
+        _busy(2_000_000)
+
+    with open(output_file, encoding='utf-8') as file:
+        lines = file.read().splitlines()
+
+    assert lines
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+    assert any('test_profiling:_busy' in line for line in lines)
+
+
+def test_sampler_skips_own_thread():
+    """
+    Проверяет, что сэмплер записывает стеки других потоков и не записывает стек потока, в котором он работает.
+    """
+
+    sampler = StackSampler()
+    thread = threading.Thread(target=sampler.sample, name='sampling-thread')
+    thread.start()
+    thread.join()
+
+    assert any('test_profiling:test_sampler_skips_own_thread' in stack for stack in sampler.stacks)
+    assert not any(stack.startswith('sampling-thread') for stack in sampler.stacks)
+
+
+def test_stage_without_profiler_is_noop():
+    """
+    Проверяет, что profiling.stage без активного профайлера ничего не делает.
+    """
+
+    with profiling.stage('idle'):
+        pass
+
+
+def test_unknown_format():
+    """
+    Проверяет ошибку при неизвестном формате профиля.
+    """
+
+    with pytest.raises(ValueError):
+        PipelineProfiler('run.out', 'json')
+
+
+def test_main_profile_mode(tmp_path, monkeypatch, capsys):
+    """
+    Проверяет режим --profile точки входа: профиль сохраняется, сводка выводится по этапам.
+    """
+
+    output_file = str(tmp_path / "main.prof")
+    saved = []
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--profile', output_file])
+    monkeypatch.setattr(main.utils, 'get_vacancies', lambda: [{"title": "Python"}])
+    monkeypatch.setattr(main.utils, 'save_vacancies', lambda vacancies, mode: saved.append(mode))
+    monkeypatch.setattr('builtins.input', lambda prompt='': '1')
+
+    main.main()
+
+    assert saved == ['1']
+    assert pstats.Stats(output_file)
+    output = capsys.readouterr().out
+    assert 'get_vacancies' in output and 'save_vacancies' in output and 'Пик памяти' in output
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+
+from src.classes import JSONVacancyStorage, XLSXVacancyStorage
+from src.query import Eq, Range, In, Contains, as_query
+
+
+@pytest.fixture
+def vacancies():
+    return [{"title": "Python Developer", "salary_min": 100000, "description": "Django, Flask"},
+            {"title": "Java Developer", "salary_min": 200000, "description": "Spring"},
+            {"title": "QA Engineer", "salary_min": "Не указано", "description": "Selenium"}]
+
+
+def test_compile_predicates(vacancies):
+    """
+    Проверяет скомпилированные предикаты для диапазонов, IN, подстрок и их комбинаций.
+    """
+
+    query = (Range('salary_min', 150000) | Contains('description', 'django')) & In('title', ['Python Developer',
+                                                                                            'QA Engineer'])
+    predicate = query.compile()
+
+    assert [v['title'] for v in vacancies if predicate(v)] == ['Python Developer']
+    assert not Range('salary_min', 0).matches(vacancies[2])
+
+
+def test_dict_criteria_is_equality(vacancies):
+    """
+    Проверяет, что словарь критериев трактуется как набор условий на равенство.
+    """
+
+    query = as_query({'title': 'QA Engineer'})
+
+    assert [v['title'] for v in vacancies if query.matches(v)] == ['QA Engineer']
+    assert query.equalities() == {'title': 'QA Engineer'}
+
+
+def test_to_mask_matches_compile(vacancies):
+    """
+    Проверяет, что маска по DataFrame совпадает с результатом Python-предиката.
+    """
+
+    query = Range('salary_min', high=150000) | Eq('title', 'QA Engineer') & Contains('description', 'SELENIUM')
+    data_frame = pd.DataFrame(vacancies)
+
+    assert query.to_mask(data_frame).tolist() == [query.matches(v) for v in vacancies]
+
+
+def test_storages_accept_query(tmp_path, vacancies):
+    """
+    Проверяет, что хранилища JSON и XLSX фильтруют и удаляют вакансии по объекту Query.
+    """
+
+    for storage in (JSONVacancyStorage(str(tmp_path / 'v.json')), XLSXVacancyStorage(str(tmp_path / 'v.xlsx'))):
+        for vacancy in vacancies:
+            storage.add_vacancy(vacancy)
+
+        assert [v['title'] for v in storage.get_vacancies(Range('salary_min', 150000))] == ['Java Developer']
+
+        storage.delete_vacancies(Contains('title', 'developer'))
+
+        assert [v['title'] for v in storage.get_vacancies({})] == ['QA Engineer']
@@ -0,0 +1,161 @@
+import pytest
+
+
+from src.classes import HHVacancyService
+from src.rate_limit import AdaptiveRateLimiter
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None, text=''):
+        self.status_code = status_code
+        self.payload = payload
+        self.headers = headers or {}
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "limiter.state")
+
+
+def test_rate_increases_on_success_up_to_max_rate():
+    """
+    Тестирует аддитивный рост скорости после успешных запросов и ограничение сверху max_rate.
+    """
+
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=5.25, increase=0.1)
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(5.1)
+
+    for _ in range(5):
+        limiter.on_success()
+    assert limiter.rate == 5.25
+
+
+def test_rate_decreases_on_throttle_down_to_min_rate():
+    """
+    Тестирует мультипликативное снижение скорости после ответа 429 и ограничение снизу min_rate.
+    """
+
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=1.5, decrease=0.5)
+
+    limiter.on_throttle()
+    assert limiter.rate == 4
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.rate == 1.5
+
+
+def test_retry_after_pauses_acquire(monkeypatch):
+    """
+    Тестирует, что после ответа с Retry-After acquire ожидает окончания паузы.
+    """
+
+    clock = [1000.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("src.rate_limit.time.time", lambda: clock[0])
+    monkeypatch.setattr("src.rate_limit.time.sleep", fake_sleep)
+
+    limiter = AdaptiveRateLimiter(rate=100)
+    limiter.on_throttle(retry_after=3)
+    limiter.acquire()
+
+    assert sleeps[0] == pytest.approx(3)
+    assert clock[0] >= 1003
+
+
+def test_state_file_is_shared_between_instances(state_file):
+    """
+    Тестирует, что ограничители с общим файлом состояния видят изменения скорости друг друга.
+    """
+
+    first = AdaptiveRateLimiter(rate=10, state_file=state_file)
+    second = AdaptiveRateLimiter(rate=10, state_file=state_file)
+
+    first.on_throttle()
+    second.on_throttle()
+
+    assert second.rate == 2.5
+
+    first.acquire()
+    assert first.rate == 2.5
+
+
+def test_fetch_page_retries_on_throttle():
+    """
+    Тестирует, что fetch_page повторяет запрос после ответа 429 и сообщает ограничителю о результате.
+    """
+
+    session = FakeSession([FakeResponse(429, headers={'Retry-After': '0'}),
+                           FakeResponse(403, text='{"errors": [{"value": "captcha_required"}]}'),
+                           FakeResponse(200, payload={"items": []})])
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000, decrease=0.5)
+    service = HHVacancyService(session=session, rate_limiter=limiter)
+
+    assert service.fetch_page({"text": "python"}) == {"items": []}
+    assert session.calls == 3
+    assert limiter.rate == pytest.approx(250.1)
+
+
+def test_fetch_page_raises_after_max_retries():
+    """
+    Тестирует, что при постоянных ответах 429 fetch_page завершается ошибкой после max_retries повторов.
+    """
+
+    session = FakeSession([FakeResponse(429) for _ in range(10)])
+    service = HHVacancyService(session=session, rate_limiter=AdaptiveRateLimiter(rate=1000, min_rate=1000))
+    service.max_retries = 2
+
+    with pytest.raises(RuntimeError):
+        service.fetch_page({"text": "python"})
+
+    assert session.calls == 3
+
+
+def test_throttle_does_not_credit_round_trip(monkeypatch):
+    """
+    Проверяет, что после ответа 429 время ожидания отклонённого запроса не засчитывается в пополнение корзины.
+    """
+
+    clock = [1000.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("src.rate_limit.time.time", lambda: clock[0])
+    monkeypatch.setattr("src.rate_limit.time.sleep", fake_sleep)
+
+    limiter = AdaptiveRateLimiter(rate=4, decrease=0.5)
+    limiter.acquire()
+    clock[0] += 0.25
+    limiter.on_throttle()
+    limiter.acquire()
+
+    assert limiter.rate == 2
+    assert sleeps == [0.5]
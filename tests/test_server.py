@@ -0,0 +1,176 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+import requests
+
+
+from src.rate_limit import AdaptiveRateLimiter
+from src.server import VacancyServer, HTTPError
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = 0
+
+    def fetch_vacancies(self, search_query):
+        self.calls += 1
+        return [{"title": "Python Developer", "url": "u1", "salary_min": 100000, "salary_max": 150000,
+                 "description": "<b>Python</b>, Django"},
+                {"title": "Senior Python Developer", "url": "u2", "salary_min": 250000, "salary_max": 300000,
+                 "description": "Python, Flask"},
+                {"title": "Java Developer", "url": "u3", "salary_min": 200000, "salary_max": 250000,
+                 "description": "Java, Spring"}]
+
+
+@pytest.fixture
+def server(tmp_path):
+    return VacancyServer(service=FakeService(), export_dir=str(tmp_path))
+
+
+def test_search_is_cached(server):
+    """
+    Проверяет, что повторный поиск с тем же запросом не обращается к API.
+    """
+
+    async def run():
+        await server.handle('GET', '/search?text=python', b'')
+        return await server.handle('GET', '/search?text=python', b'')
+
+    status, result = asyncio.run(run())
+
+    assert status == HTTPStatus.OK
+    assert len(result) == 3
+    assert server.service.calls == 1
+
+
+def test_top_filters_and_sorts(server):
+    """
+    Проверяет, что /top фильтрует по ключевым словам и возвращает вакансии по убыванию зарплаты.
+    """
+
+    status, result = asyncio.run(server.handle('GET', '/top?text=python&n=1&keywords=Python', b''))
+
+    assert status == HTTPStatus.OK
+    assert [v['url'] for v in result] == ['u2']
+
+
+def test_export(server, tmp_path):
+    """
+    Проверяет сохранение результатов поиска в файл выбранного формата.
+    """
+
+    body = json.dumps({'text': 'python', 'format': 'json', 'filename': '../report'}).encode()
+    status, result = asyncio.run(server.handle('POST', '/export', body))
+
+    with open(tmp_path / 'report.json', encoding='utf-8') as f:
+        assert len(json.load(f)) == 3
+
+    assert result['count'] == 3
+    assert list(result['filenames']) == ['json']
+
+
+def test_unknown_path(server):
+    """
+    Проверяет ответ на запрос к неизвестному пути.
+    """
+
+    with pytest.raises(HTTPError) as error:
+        asyncio.run(server.handle('GET', '/unknown', b''))
+
+    assert error.value.status == HTTPStatus.NOT_FOUND
+
+
+def test_http_roundtrip(server):
+    """
+    Проверяет обработку двух запросов в одном keep-alive соединении.
+    """
+
+    async def run():
+        tcp_server = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        statuses = []
+
+        for connection in ('keep-alive', 'close'):
+            writer.write(f"GET /search?text=python HTTP/1.1\r\nConnection: {connection}\r\n\r\n".encode())
+            await writer.drain()
+            statuses.append(await reader.readline())
+            headers = {}
+
+            while (line := await reader.readline()) != b'\r\n':
+                name, _, value = line.decode().partition(':')
+                headers[name.lower()] = value.strip()
+
+            await reader.readexactly(int(headers['content-length']))
+
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+        return statuses
+
+    assert asyncio.run(run()) == [b'HTTP/1.1 200 OK\r\n'] * 2
+
+
+def test_cache_is_bounded(tmp_path, monkeypatch):
+    """
+    Проверяет, что кэш не превышает cache_size, а устаревшие записи удаляются при добавлении новых.
+    """
+
+    clock = [0.0]
+    monkeypatch.setattr('src.server.time.monotonic', lambda: clock[0])
+    server = VacancyServer(service=FakeService(), cache_ttl=10, cache_size=2, export_dir=str(tmp_path))
+
+    async def search(*texts):
+        for text in texts:
+            await server.search(text)
+
+    asyncio.run(search('a', 'b', 'c'))
+    assert list(server._cache) == ['b', 'c']
+
+    clock[0] = 20
+    asyncio.run(search('d'))
+    assert list(server._cache) == ['d']
+
+
+@pytest.mark.parametrize('error, status', [(requests.ConnectionError("hh.ru недоступен"), b'502'),
+                                           (ZeroDivisionError("ошибка в коде"), b'500')])
+def test_error_statuses(tmp_path, error, status):
+    """
+    Проверяет, что ошибки API возвращаются как 502, а внутренние ошибки сервиса - как 500.
+    """
+
+    class FailingService:
+        def fetch_vacancies(self, search_query):
+            raise error
+
+    server = VacancyServer(service=FailingService(), export_dir=str(tmp_path))
+
+    async def run():
+        tcp_server = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b"GET /search?text=python HTTP/1.1\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+        return status_line
+
+    assert asyncio.run(run()).split()[1] == status
+
+
+def test_default_service_uses_adaptive_rate_limiter(tmp_path):
+    """
+    Проверяет, что сервис по умолчанию ограничивает частоту запросов и может делить квоту через файл состояния.
+    """
+
+    state_file = str(tmp_path / 'limiter.state')
+    server = VacancyServer(rate_limit_state=state_file)
+
+    assert isinstance(server.service.rate_limiter, AdaptiveRateLimiter)
+    assert server.service.rate_limiter.state_file == state_file
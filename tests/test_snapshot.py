@@ -0,0 +1,105 @@
+import os
+
+import numpy as np
+
+
+from src.classes import JSONVacancyStorage
+from src.mmap_index import HEADER_DTYPE
+from src.snapshot import FINGERPRINT_DTYPE, SnapshotIndex, diff_storages, select_by_url_hash
+
+
+def _make_storage(path, vacancies):
+    storage = JSONVacancyStorage(str(path))
+    storage._save_data(vacancies)
+
+    return storage
+
+
+def test_diff_snapshots(tmp_path):
+    """
+    Проверяет определение добавленных, удалённых и изменённых вакансий между двумя снимками.
+    """
+
+    old = [{"title": "A", "url": "u1", "salary_min": 100}, {"title": "B", "url": "u2", "salary_min": 200},
+           {"title": "C", "url": "u3", "salary_min": 300}]
+    new = [{"salary_min": 100, "url": "u1", "title": "A"}, {"title": "B", "url": "u2", "salary_min": 250},
+           {"title": "D", "url": "u4", "salary_min": 400}]
+
+    diff = diff_storages(_make_storage(tmp_path / 'old.json', old), _make_storage(tmp_path / 'new.json', new))
+
+    assert [v['title'] for v in select_by_url_hash(new, diff.added)] == ['D']
+    assert [v['title'] for v in select_by_url_hash(old, diff.removed)] == ['C']
+    assert [v['title'] for v in select_by_url_hash(new, diff.changed)] == ['B']
+    assert os.path.getsize(tmp_path / "new.json.fp") == HEADER_DTYPE.itemsize + 16 * 3
+
+
+def test_diff_with_empty_snapshot():
+    """
+    Проверяет сравнение с пустым снимком.
+    """
+
+    empty = SnapshotIndex.from_vacancies([])
+    full = SnapshotIndex.from_vacancies([{"url": "u1"}, {"url": "u1", "title": "dup"}])
+
+    assert len(full) == 1
+    assert len(empty.diff(full).added) == 1
+    assert len(full.diff(empty).removed) == 1
+    assert len(full.diff(full).changed) == 0
+
+
+def test_index_rebuilt_when_stamp_differs(tmp_path, monkeypatch):
+    """
+    Проверяет, что индекс перестраивается после подмены файла данных, даже если время изменения не изменилось,
+    а при неизменном файле читается из .fp без обращения к данным.
+    """
+
+    storage = _make_storage(tmp_path / 'data.json', [{"title": "A", "url": "u1"}])
+    stat = os.stat(storage.filename)
+    first = SnapshotIndex.for_storage(storage)
+
+    storage._save_data([{"title": "B", "url": "u1"}])
+    os.utime(storage.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    second = SnapshotIndex.for_storage(storage)
+
+    assert len(first.diff(second).changed) == 1
+
+    monkeypatch.setattr(storage, '_iter_data', lambda: (_ for _ in ()).throw(AssertionError("rebuild")))
+    assert np.array_equal(SnapshotIndex.for_storage(storage).fingerprints, second.fingerprints)
+
+
+def test_index_built_by_streaming(tmp_path, monkeypatch):
+    """
+    Проверяет, что при построении индекса записи читаются потоково, без загрузки всего файла в список.
+    """
+
+    storage = _make_storage(tmp_path / 'data.json', [{"title": str(i), "url": f"u{i}"} for i in range(5)])
+    monkeypatch.setattr(storage, '_load_data', lambda: (_ for _ in ()).throw(AssertionError("full load")))
+    monkeypatch.setattr(storage, 'get_vacancies', lambda criteria: (_ for _ in ()).throw(AssertionError("full load")))
+
+    assert len(SnapshotIndex.for_storage(storage)) == 5
+
+
+def test_diff_matches_set_semantics():
+    """
+    Проверяет линейное слияние на случайных снимках по сравнению с вычислением через множества.
+    """
+
+    generator = np.random.default_rng(0)
+
+    def snapshot(urls):
+        fingerprints = np.zeros(len(urls), dtype=FINGERPRINT_DTYPE)
+        fingerprints['url'] = np.sort(urls)
+        fingerprints['content'] = fingerprints['url'] % 7 + generator.integers(0, 2, len(urls))
+
+        return SnapshotIndex(fingerprints)
+
+    old = snapshot(generator.choice(1000, 400, replace=False).astype(np.uint64))
+    new = snapshot(generator.choice(1000, 400, replace=False).astype(np.uint64))
+    diff = old.diff(new)
+    old_map = dict(zip(old.fingerprints['url'].tolist(), old.fingerprints['content'].tolist()))
+    new_map = dict(zip(new.fingerprints['url'].tolist(), new.fingerprints['content'].tolist()))
+
+    assert diff.added.tolist() == sorted(new_map.keys() - old_map.keys())
+    assert diff.removed.tolist() == sorted(old_map.keys() - new_map.keys())
+    assert diff.changed.tolist() == sorted(url for url in old_map.keys() & new_map.keys()
+                                           if old_map[url] != new_map[url])
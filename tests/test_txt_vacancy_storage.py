@@ -0,0 +1,111 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+
+from src.classes import TXTVacancyStorage
+from src.query import Contains
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """
+    Создает хранилище TXT с тремя вакансиями.
+    """
+
+    storage = TXTVacancyStorage(str(tmp_path / 'vacancies.txt'))
+    storage.add_vacancies([{"title": "Python Developer", "url": "u1", "salary_min": 100000, "salary_max": None},
+                           {"title": "Java\tDeveloper", "url": "u2", "salary_min": "Не указано",
+                            "description": "Строка 1\nСтрока 2 \\n"},
+                           {"title": "QA Engineer", "url": "u3", "salary_min": 50000}])
+
+    return storage
+
+
+def test_records_are_readable_lines(storage):
+    """
+    Проверяет, что каждая вакансия записана отдельной читаемой строкой.
+    """
+
+    with open(storage.filename, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+
+    assert len(lines) == 3
+    assert lines[0] == "title: Python Developer\turl: u1\tsalary_min: 100000\tsalary_max: null"
+
+
+def test_roundtrip_and_search(storage):
+    """
+    Проверяет восстановление значений с экранированными символами и поиск по критериям.
+    """
+
+    vacancy = storage.get_vacancies({'url': 'u2'})[0]
+
+    assert vacancy == {"title": "Java\tDeveloper", "url": "u2", "salary_min": "Не указано",
+                       "description": "Строка 1\nСтрока 2 \\n"}
+    assert storage.get_vacancies({'salary_min': 100000})[0]['salary_max'] is None
+
+
+def test_add_does_not_read_file(storage, monkeypatch):
+    """
+    Проверяет, что добавление вакансии не читает существующий файл.
+    """
+
+    monkeypatch.setattr(TXTVacancyStorage, '_load_data', lambda self: pytest.fail("файл не должен читаться"))
+    monkeypatch.setattr(TXTVacancyStorage, '_iter_data', lambda self: pytest.fail("файл не должен читаться"))
+    storage.add_vacancy({"title": "DevOps", "url": "u4"})
+
+    assert storage.get_vacancies({'url': 'u4'}) == [{"title": "DevOps", "url": "u4"}]
+
+
+def test_delete_vacancies(storage):
+    """
+    Проверяет удаление вакансий по условию.
+    """
+
+    storage.delete_vacancies(Contains('title', 'developer'))
+
+    assert [v['url'] for v in storage.get_vacancies({})] == ['u3']
+
+
+def test_roundtrip_strings_that_look_like_json(tmp_path):
+    """
+    Проверяет, что строки, похожие на значения JSON, и названия полей с двоеточием восстанавливаются без изменений.
+    """
+
+    storage = TXTVacancyStorage(str(tmp_path / 'vacancies.txt'))
+    vacancy = {"title": "2024", "salary_min": "100000", "salary_max": 100000, "description": "null",
+               "quoted": '"a"', "flag": "true", "list": "[1]", "k: v": "a: b", "path": "C:\\new\\c"}
+    storage.add_vacancies([vacancy])
+
+    assert storage.get_vacancies({}) == [vacancy]
+    assert storage.get_vacancies({'salary_min': '100000'}) == [vacancy]
+    assert storage.get_vacancies({'salary_max': 100000}) == [vacancy]
+    assert storage.get_vacancies({'salary_min': 100000}) == []
+
+
+def test_delete_then_append_with_reused_inode(tmp_path, monkeypatch):
+    """
+    Проверяет, что после удаления (атомарной перезаписи файла с прежним inode) и дописывания индекс TXT перестраивается
+    и не применяет старые смещения к новому содержимому.
+    """
+
+    real_fstat = os.fstat
+    monkeypatch.setattr('src.mmap_index.os.fstat', lambda fd: SimpleNamespace(
+        st_size=real_fstat(fd).st_size, st_mtime_ns=real_fstat(fd).st_mtime_ns, st_ino=42))
+
+    storage = TXTVacancyStorage(str(tmp_path / 'vacancies.txt'))
+    vacancies = [{"title": f"Vacancy {index}", "url": f"u{index}", "salary_min": index * 1000} for index in range(20)]
+    storage.add_vacancies(vacancies)
+    storage.get_vacancies({})
+
+    storage.delete_vacancies({'url': 'u3'})
+    storage.delete_vacancies({'url': 'u4'})
+    storage.add_vacancies(vacancies[:5])
+
+    expected = vacancies[:3] + vacancies[5:] + vacancies[:5]
+
+    assert storage.get_vacancies({}) == expected
+    assert TXTVacancyStorage(storage.filename).get_vacancies({}) == expected
+    assert storage.get_vacancies({'url': 'u3'}) == [vacancies[3]]